@@ -47,6 +47,7 @@ class Settings(BaseSettings):
     fallback_llm_api_key: str = ""    # API key for the fallback endpoint
     fallback_llm_model: str = ""      # e.g. "gpt-4o-mini" — if empty, uses llm_model value
     fallback_embedding_model: str = ""  # e.g. "text-embedding-3-small" — for embedding fallback
+    fallback_llm_race_on_degraded: bool = False  # race Ollama vs fallback while Ollama recovers
     heartbeat_check_interval_days: int = 30
     heartbeat_trigger_days: int = 90
     alert_email: str = ""
@@ -96,6 +96,13 @@ def _run_migrations(eng) -> None:
                     text(f"ALTER TABLE persons ADD COLUMN {col_name} {col_def}")
                 )
 
+    # GEDCOM import looks persons up by gedcom_id in bulk
+    with eng.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_persons_gedcom_id "
+            "ON persons(gedcom_id)"
+        ))
+
 
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
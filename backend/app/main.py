@@ -56,6 +56,7 @@ async def lifespan(app: FastAPI):
             fallback_url=settings.fallback_llm_url,
             fallback_api_key=settings.fallback_llm_api_key,
             fallback_model=settings.fallback_llm_model,
+            race_on_degraded=settings.fallback_llm_race_on_degraded,
         )
         app.state.llm_service = llm_service
 
@@ -203,6 +204,10 @@ async def lifespan(app: FastAPI):
     # Shutdown: wipe all in-memory master keys
     auth_state.wipe_all()
 
+    # Shutdown: close pooled LLM HTTP client
+    if getattr(app.state, "llm_service", None) is not None:
+        await app.state.llm_service.close()
+
     # Shutdown: close geocoding HTTP client
     if getattr(app.state, "geocoding_service", None) is not None:
         await app.state.geocoding_service.close()
@@ -48,7 +48,7 @@ class Person(SQLModel, table=True):
     face_thumbnail_path: str | None = Field(default=None)
     relationship_to_owner: str | None = Field(default=None, index=True)
     is_deceased: bool = Field(default=False)
-    gedcom_id: str | None = Field(default=None, unique=True)
+    gedcom_id: str | None = Field(default=None, unique=True, index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timedelta, timezone
@@ -648,8 +649,9 @@ async def reprocess_exif(
         raise HTTPException(status_code=500, detail="Failed to read vault file")
 
     # Extract EXIF GPS and metadata — fully local, no external API calls
-    lat, lng = IngestionService._extract_gps_from_exif(file_data)
-    exif_metadata = IngestionService._extract_exif_metadata(file_data)
+    lat, lng, exif_metadata = await asyncio.to_thread(
+        IngestionService._extract_photo_exif, file_data
+    )
 
     # Update memory fields
     if lat is not None and lng is not None:
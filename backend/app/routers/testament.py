@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timedelta, timezone
+from hmac import compare_digest
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
@@ -309,8 +310,9 @@ async def activate_heir_mode(
     if verifier is None:
         raise HTTPException(status_code=500, detail="Auth not configured")
 
+    # Compare in constant time, as the login and heartbeat paths do
     computed_hmac = hmac_sha256(reconstructed_key, b"auth_check")
-    if computed_hmac != verifier.hmac_verifier:
+    if not compare_digest(computed_hmac, verifier.hmac_verifier):
         raise HTTPException(status_code=401, detail="Invalid shares or passphrase")
 
     # Activate heir mode
@@ -54,10 +54,20 @@ def import_gedcom_file(
         return result
 
     # 2. First pass: create/update persons
-    for element in parser.get_root_child_elements():
-        if not isinstance(element, IndividualElement):
-            continue
-        _process_individual(element, db_session, result)
+    individuals = [
+        element
+        for element in parser.get_root_child_elements()
+        if isinstance(element, IndividualElement)
+    ]
+    existing_by_gedcom = _fetch_existing_persons(
+        [element.get_pointer() for element in individuals], db_session,
+    )
+    new_persons: list[Person] = []
+    for element in individuals:
+        person = _process_individual(element, existing_by_gedcom, result)
+        if person is not None:
+            new_persons.append(person)
+    _insert_persons(new_persons, db_session, result)
     db_session.commit()
 
     # 3. Build lookup
@@ -83,12 +93,31 @@ def import_gedcom_file(
     return result
 
 
+def _fetch_existing_persons(
+    gedcom_ids: list[str],
+    db: Session,
+) -> dict[str, Person]:
+    """Return dict mapping gedcom_id -> Person for the given ids in one query."""
+    if not gedcom_ids:
+        return {}
+    existing = db.exec(
+        select(Person).where(Person.gedcom_id.in_(gedcom_ids))
+    ).all()
+    return {p.gedcom_id: p for p in existing}
+
+
 def _process_individual(
     element: IndividualElement,
-    db: Session,
+    existing_by_gedcom: dict[str, Person],
     result: GedcomImportResult,
-) -> None:
-    """Extract data from an IndividualElement and create/update a Person."""
+) -> Person | None:
+    """Extract data from an IndividualElement and update or build a Person.
+
+    Existing persons (from the prefetched ``existing_by_gedcom`` lookup) are
+    updated in place. New persons are returned unsaved so the caller can
+    insert them in one batch; they are also added to the lookup so duplicate
+    pointers in the same file update rather than collide.
+    """
     gedcom_id = element.get_pointer()
 
     # Extract name
@@ -106,40 +135,63 @@ def _process_individual(
     except Exception:
         is_deceased = False
 
-    # Savepoint for error isolation
+    existing = existing_by_gedcom.get(gedcom_id)
+    if existing:
+        changed = False
+        if existing.name != name:
+            existing.name = name
+            changed = True
+        if existing.is_deceased != is_deceased:
+            existing.is_deceased = is_deceased
+            changed = True
+        if changed:
+            existing.updated_at = datetime.now(timezone.utc)
+        result.persons_updated += 1
+        return None
+
+    person = Person(
+        name=name,
+        gedcom_id=gedcom_id,
+        is_deceased=is_deceased,
+    )
+    existing_by_gedcom[gedcom_id] = person
+    return person
+
+
+def _insert_persons(
+    persons: list[Person],
+    db: Session,
+    result: GedcomImportResult,
+) -> None:
+    """Insert new persons with a single flush.
+
+    If the batch fails, fall back to one savepoint per person so a single
+    bad record is skipped instead of aborting the whole import.
+    """
+    if not persons:
+        return
+
     nested = db.begin_nested()
     try:
-        existing = db.exec(
-            select(Person).where(Person.gedcom_id == gedcom_id)
-        ).first()
-
-        if existing:
-            changed = False
-            if existing.name != name:
-                existing.name = name
-                changed = True
-            if existing.is_deceased != is_deceased:
-                existing.is_deceased = is_deceased
-                changed = True
-            if changed:
-                existing.updated_at = datetime.now(timezone.utc)
-                db.add(existing)
-            result.persons_updated += 1
-        else:
-            person = Person(
-                name=name,
-                gedcom_id=gedcom_id,
-                is_deceased=is_deceased,
-            )
-            db.add(person)
-            result.persons_created += 1
-
+        db.add_all(persons)
         db.flush()
         nested.commit()
-    except Exception as e:
+        result.persons_created += len(persons)
+        return
+    except Exception:
         nested.rollback()
-        result.errors.append(f"Failed to process {gedcom_id}: {e}")
-        result.persons_skipped += 1
+
+    for person in persons:
+        nested = db.begin_nested()
+        try:
+            db.add(person)
+            db.flush()
+            nested.commit()
+            result.persons_created += 1
+        except Exception as e:
+            nested.rollback()
+            result.errors.append(f"Failed to process {person.gedcom_id}: {e}")
+            result.persons_skipped += 1
 
 
 def _build_gedcom_lookup(db: Session) -> dict[str, Person]:
@@ -195,55 +247,45 @@ def _build_family_graph(
     return parent_of, child_of, spouse_of
 
 
-def _compute_relationship(
+def _compute_relationships(
     owner_id: str,
-    target_id: str,
     parent_of: dict[str, set[str]],
     child_of: dict[str, set[str]],
     spouse_of: dict[str, set[str]],
-) -> str:
-    """Compute the relationship of target relative to owner.
+) -> dict[str, str]:
+    """Compute the relationship to owner for everyone near the owner.
+
+    Walks the owner's neighbourhood once and returns a dict mapping
+    gedcom_id -> relationship. Anyone not in the dict is "other".
 
     Priority order: spouse -> child -> parent -> sibling ->
     grandparent -> grandchild -> other.
     """
-    # Spouse
-    if target_id in spouse_of.get(owner_id, set()):
-        return "spouse"
-
-    # Child (owner is parent of target)
-    if target_id in parent_of.get(owner_id, set()):
-        return "child"
-
-    # Parent (owner is child of target)
-    if target_id in child_of.get(owner_id, set()):
-        return "parent"
-
-    # Sibling (shared parents)
     owner_parents = child_of.get(owner_id, set())
-    siblings: set[str] = set()
-    for p in owner_parents:
-        siblings |= parent_of.get(p, set())
-    siblings.discard(owner_id)
-    if target_id in siblings:
-        return "sibling"
+    owner_children = parent_of.get(owner_id, set())
 
-    # Grandparent (2 hops up)
+    siblings: set[str] = set()
     grandparents: set[str] = set()
     for p in owner_parents:
+        siblings |= parent_of.get(p, set())
         grandparents |= child_of.get(p, set())
-    if target_id in grandparents:
-        return "grandparent"
 
-    # Grandchild (2 hops down)
-    owner_children = parent_of.get(owner_id, set())
     grandchildren: set[str] = set()
     for c in owner_children:
         grandchildren |= parent_of.get(c, set())
-    if target_id in grandchildren:
-        return "grandchild"
 
-    return "other"
+    relationships: dict[str, str] = {owner_id: "self"}
+    for label, members in (
+        ("spouse", spouse_of.get(owner_id, set())),
+        ("child", owner_children),
+        ("parent", owner_parents),
+        ("sibling", siblings),
+        ("grandparent", grandparents),
+        ("grandchild", grandchildren),
+    ):
+        for gid in members:
+            relationships.setdefault(gid, label)
+    return relationships
 
 
 def _apply_relationships(
@@ -256,6 +298,10 @@ def _apply_relationships(
     result: GedcomImportResult,
 ) -> None:
     """Compute and apply relationship_to_owner for all persons."""
+    relationships = _compute_relationships(
+        owner_gedcom_id, parent_of, child_of, spouse_of,
+    )
+
     # Snapshot IDs before modifying session
     person_snapshots = {
         gid: {"id": p.id, "name": p.name}
@@ -271,12 +317,7 @@ def _apply_relationships(
         if person.relationship_to_owner is not None:
             continue
 
-        if gid == owner_gedcom_id:
-            person.relationship_to_owner = "self"
-        else:
-            person.relationship_to_owner = _compute_relationship(
-                owner_gedcom_id, gid, parent_of, child_of, spouse_of,
-            )
+        person.relationship_to_owner = relationships.get(gid, "other")
 
         person.updated_at = datetime.now(timezone.utc)
         db.add(person)
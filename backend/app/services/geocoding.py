@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import httpx
@@ -42,9 +43,11 @@ class GeocodingService:
     NOMINATIM_SEARCH_URL = "https://nominatim.openstreetmap.org/search"
     USER_AGENT = "Mnemos/1.0 (self-hosted second brain; contact: admin@localhost)"
     MIN_REQUEST_INTERVAL = 1.0  # seconds — Nominatim ToS
+    REVERSE_CACHE_SIZE = 4096  # entries; keyed by coords rounded to ~11 m
 
     def __init__(self, enabled: bool = True) -> None:
         self._enabled = enabled
+        self._reverse_cache: OrderedDict[tuple[float, float], GeocodingResult] = OrderedDict()
         self._last_request_time: float = 0.0
         self._lock = asyncio.Lock()
         self._client = httpx.AsyncClient(
@@ -62,11 +65,19 @@ class GeocodingService:
         Fully offline — uses the `reverse_geocoder` package with bundled
         city/country data (~25MB). No network calls, no privacy leak.
 
-        Returns None if geocoding is disabled or lookup fails.
+        Successful lookups are kept in a bounded LRU cache keyed by the
+        coordinates rounded to 4 decimal places, well below city-level
+        granularity. Returns None if geocoding is disabled or lookup fails.
         """
         if not self._enabled:
             return None
 
+        key = (round(lat, 4), round(lng, 4))
+        cached = self._reverse_cache.get(key)
+        if cached is not None:
+            self._reverse_cache.move_to_end(key)
+            return cached
+
         try:
             results = rg.search((lat, lng))
             if not results:
@@ -81,7 +92,7 @@ class GeocodingService:
             parts = [p for p in [city, admin1, cc] if p]
             display_name = ", ".join(parts) if parts else f"{lat}, {lng}"
 
-            return GeocodingResult(
+            geocoded = GeocodingResult(
                 display_name=display_name,
                 city=city,
                 country=cc,
@@ -95,6 +106,11 @@ class GeocodingService:
             )
             return None
 
+        self._reverse_cache[key] = geocoded
+        if len(self._reverse_cache) > self.REVERSE_CACHE_SIZE:
+            self._reverse_cache.popitem(last=False)
+        return geocoded
+
     def reverse_geocode_and_encrypt(
         self, lat: float, lng: float, encryption_service: EncryptionService
     ) -> tuple[str, str] | None:
@@ -102,6 +118,9 @@ class GeocodingService:
 
         Returns None if geocoding fails or is disabled.
         """
+        if not self._enabled:
+            return None
+
         result = self.reverse_geocode(lat, lng)
         if result is None:
             return None
@@ -58,6 +58,30 @@ class GitOpsService:
             message=message or f"Update memory {memory_id}",
         )
 
+    def commit_memories(
+        self,
+        contents: dict[str, str],
+        *,
+        message: str | None = None,
+    ) -> str:
+        """Write several memories' encrypted content and commit them together.
+
+        ``contents`` maps memory_id -> encrypted content. All files are
+        staged in one index write and recorded in a single commit.
+
+        Returns the commit SHA as a hex string, or empty string if
+        nothing changed.
+        """
+        if not contents:
+            return ""
+        return self._commit_files(
+            {
+                f"memories/{memory_id}.md": content
+                for memory_id, content in contents.items()
+            },
+            message=message or f"Update {len(contents)} memories",
+        )
+
     def commit_connection(
         self,
         connection_id: str,
@@ -156,17 +180,29 @@ class GitOpsService:
 
         Returns the commit SHA, or empty string if nothing changed.
         """
-        full_path = self._git_root / relative_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
+        return self._commit_files({relative_path: content}, message=message)
+
+    def _commit_files(
+        self, files: dict[str, str], *, message: str
+    ) -> str:
+        """Write each relative_path -> content, stage them together, and commit.
+
+        Returns the commit SHA, or empty string if nothing changed.
+        """
+        for relative_path, content in files.items():
+            full_path = self._git_root / relative_path
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_text(content, encoding="utf-8")
 
-        self._repo.index.add([relative_path])
+        self._repo.index.add(list(files))
 
-        # Check if there are staged changes (skip on first commit when HEAD doesn't exist)
+        # Check if there are staged changes (skip on first commit when HEAD doesn't exist).
+        # Comparing tree SHAs stays in-process, unlike index.diff("HEAD").
         if self._repo.head.is_valid():
-            if not self._repo.index.diff("HEAD"):
+            head_commit = self._repo.head.commit
+            if self._repo.index.write_tree().binsha == head_commit.tree.binsha:
                 # Nothing changed — return current HEAD SHA
-                return str(self._repo.head.commit.hexsha)
+                return str(head_commit.hexsha)
 
         commit = self._repo.index.commit(message)
         return str(commit.hexsha)
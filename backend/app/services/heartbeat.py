@@ -184,16 +184,18 @@ class HeartbeatService:
         days_since = (now - last_checkin.checked_in_at).days
         new_alerts: list[HeartbeatAlert] = []
 
+        # Alert types already sent after the last check-in, fetched in one query
+        already_sent = set(
+            db.exec(
+                select(HeartbeatAlert.alert_type).where(
+                    HeartbeatAlert.sent_at > last_checkin.checked_in_at,
+                )
+            ).all()
+        )
+
         for threshold_days, alert_type, recipient_type in self.ALERT_THRESHOLDS:
             if days_since >= threshold_days:
-                # Check if this alert type was already sent after the last check-in
-                existing = db.exec(
-                    select(HeartbeatAlert).where(
-                        HeartbeatAlert.alert_type == alert_type,
-                        HeartbeatAlert.sent_at > last_checkin.checked_in_at,
-                    )
-                ).first()
-                if existing is not None:
+                if alert_type in already_sent:
                     continue
 
                 delivered = self._dispatch_alert(
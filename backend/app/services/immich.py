@@ -1,9 +1,12 @@
 """Immich integration service — sync people and faces between Immich and Mnemos."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -52,44 +55,82 @@ class _CacheEntry:
 
 
 class ImmichService:
-    """Sync people and face data between Immich and Mnemos."""
+    """Sync people and face data between Immich and Mnemos.
+
+    Pass *client* to reuse one connection pool across requests; the caller
+    owns it and must close it. Without one, each request opens and closes
+    its own client, except within a people sync, which shares one.
+    """
 
     _MEMORIES_CACHE_TTL = 300.0  # 5 minutes
+    _THUMBNAIL_CONCURRENCY = 16
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, client: httpx.AsyncClient | None = None
+    ) -> None:
         self._base_url = settings.immich_url.rstrip("/")
         self._api_key = settings.immich_api_key
         self._timeout = 30.0
         self._thumbnails_dir = settings.data_dir / "immich_thumbnails"
         self._memories_cache: _CacheEntry | None = None
+        self._client = client
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the injected client, or a short-lived one if none was given."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
+
+    @asynccontextmanager
+    async def _shared_client(self) -> AsyncIterator[None]:
+        """Route every request made inside the block through one client.
+
+        Without an injected client, each request would otherwise open its
+        own connection; a sync fans out to many at once.
+        """
+        if self._client is not None:
+            yield
+            return
+        async with httpx.AsyncClient() as client:
+            self._client = client
+            try:
+                yield
+            finally:
+                self._client = None
 
     async def _get(
         self, path: str, params: dict[str, str] | None = None
     ) -> httpx.Response:
         """Make an authenticated GET request to Immich API."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with self._http() as client:
             return await client.get(
                 f"{self._base_url}{path}",
                 params=params,
                 headers={"x-api-key": self._api_key, "Accept": "application/json"},
+                timeout=self._timeout,
             )
 
     async def _post(self, path: str, json: dict) -> httpx.Response:
         """Make an authenticated POST request to Immich API."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with self._http() as client:
             return await client.post(
                 f"{self._base_url}{path}",
                 json=json,
                 headers={"x-api-key": self._api_key, "Accept": "application/json"},
+                timeout=self._timeout,
             )
 
     async def _put(self, path: str, json: dict) -> httpx.Response:
         """Make an authenticated PUT request to Immich API."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with self._http() as client:
             return await client.put(
                 f"{self._base_url}{path}",
                 json=json,
                 headers={"x-api-key": self._api_key, "Accept": "application/json"},
+                timeout=self._timeout,
             )
 
     async def _download_thumbnail(self, person_id: str) -> str | None:
@@ -100,10 +141,11 @@ class ImmichService:
         try:
             safe_id = _validate_id(person_id)
             self._thumbnails_dir.mkdir(parents=True, exist_ok=True)
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
+            async with self._http() as client:
                 resp = await client.get(
                     f"{self._base_url}/api/people/{safe_id}/thumbnail",
                     headers={"x-api-key": self._api_key},
+                    timeout=self._timeout,
                 )
                 resp.raise_for_status()
                 out_path = self._thumbnails_dir / f"{safe_id}.jpg"
@@ -113,8 +155,29 @@ class ImmichService:
             logger.warning("Failed to download thumbnail for person %s", person_id, exc_info=True)
             return None
 
+    async def _download_thumbnails(
+        self, immich_ids: list[str]
+    ) -> dict[str, str | None]:
+        """Download face thumbnails concurrently, a bounded number at a time.
+
+        Returns dict mapping person id -> relative path, or None on failure.
+        """
+        semaphore = asyncio.Semaphore(self._THUMBNAIL_CONCURRENCY)
+
+        async def _download(immich_id: str) -> str | None:
+            async with semaphore:
+                return await self._download_thumbnail(immich_id)
+
+        paths = await asyncio.gather(*(_download(i) for i in immich_ids))
+        return dict(zip(immich_ids, paths))
+
     async def sync_people(self, session: Session) -> SyncPeopleResult:
         """Sync all people from Immich into the local Person table."""
+        async with self._shared_client():
+            return await self._sync_people(session)
+
+    async def _sync_people(self, session: Session) -> SyncPeopleResult:
+        """Body of :meth:`sync_people`, run inside one shared client."""
         result = SyncPeopleResult()
 
         try:
@@ -126,6 +189,16 @@ class ImmichService:
 
         data = resp.json()
         people = data.get("people", [])
+        # Malformed entries are skipped here and counted as errors in the
+        # per-person loop below, rather than aborting the whole sync.
+        safe_ids = list(dict.fromkeys(
+            p["id"] for p in people
+            if isinstance(p, dict)
+            and isinstance(p.get("id"), str)
+            and _SAFE_ID_RE.match(p["id"])
+        ))
+        existing_by_immich_id = self._fetch_existing_persons(safe_ids, session)
+        thumbnails = await self._download_thumbnails(safe_ids)
 
         for immich_person in people:
             nested = session.begin_nested()
@@ -134,10 +207,7 @@ class ImmichService:
                 immich_name = immich_person.get("name", "").strip()
                 display_name = immich_name  # Keep empty for unnamed — frontend shows these in "Untagged Faces"
 
-                # Look up existing local person
-                existing = session.exec(
-                    select(Person).where(Person.immich_person_id == immich_id)
-                ).first()
+                existing = existing_by_immich_id.get(immich_id)
 
                 if existing:
                     changed = False
@@ -146,8 +216,8 @@ class ImmichService:
                         existing.name = immich_name
                         changed = True
 
-                    # Download/update thumbnail
-                    thumb_path = await self._download_thumbnail(immich_id)
+                    # Update thumbnail
+                    thumb_path = thumbnails.get(immich_id)
                     if thumb_path and existing.face_thumbnail_path != thumb_path:
                         existing.face_thumbnail_path = thumb_path
                         changed = True
@@ -158,8 +228,7 @@ class ImmichService:
                     else:
                         result.unchanged += 1
                 else:
-                    # Download thumbnail for new person
-                    thumb_path = await self._download_thumbnail(immich_id)
+                    thumb_path = thumbnails.get(immich_id)
 
                     person = Person(
                         name=display_name,
@@ -170,12 +239,15 @@ class ImmichService:
                     result.created += 1
 
                 nested.commit()
+                if existing is None:
+                    existing_by_immich_id[immich_id] = person
 
             except Exception:
                 nested.rollback()
                 logger.warning(
                     "Failed to sync person %s from Immich",
-                    immich_person.get("id", "unknown"),
+                    immich_person.get("id", "unknown")
+                    if isinstance(immich_person, dict) else immich_person,
                     exc_info=True,
                 )
                 result.errors += 1
@@ -183,6 +255,18 @@ class ImmichService:
         session.commit()
         return result
 
+    @staticmethod
+    def _fetch_existing_persons(
+        immich_ids: list[str], session: Session
+    ) -> dict[str, Person]:
+        """Return dict mapping immich_person_id -> Person in one query."""
+        if not immich_ids:
+            return {}
+        existing = session.exec(
+            select(Person).where(Person.immich_person_id.in_(immich_ids))
+        ).all()
+        return {p.immich_person_id: p for p in existing}
+
     async def sync_faces_for_asset(
         self, asset_id: str, memory_id: str, session: Session
     ) -> SyncFacesResult:
@@ -320,10 +404,11 @@ class ImmichService:
         Raises on failure.
         """
         safe_id = _validate_id(asset_id)
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with self._http() as client:
             resp = await client.get(
                 f"{self._base_url}/api/assets/{safe_id}/thumbnail",
                 headers={"x-api-key": self._api_key},
+                timeout=self._timeout,
             )
             if resp.status_code == 404:
                 # Thumbnails not yet generated — fall back to original
@@ -331,6 +416,7 @@ class ImmichService:
                     f"{self._base_url}/api/assets/{safe_id}/original",
                     headers={"x-api-key": self._api_key},
                     follow_redirects=True,
+                    timeout=self._timeout,
                 )
             resp.raise_for_status()
             content_type = resp.headers.get("content-type", "image/jpeg")
@@ -343,11 +429,12 @@ class ImmichService:
         Raises on failure.
         """
         safe_id = _validate_id(asset_id)
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._http() as client:
             resp = await client.get(
                 f"{self._base_url}/api/assets/{safe_id}/original",
                 headers={"x-api-key": self._api_key},
                 follow_redirects=True,
+                timeout=120.0,
             )
             resp.raise_for_status()
             content_type = resp.headers.get("content-type", "image/jpeg")
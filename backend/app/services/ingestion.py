@@ -7,6 +7,7 @@ and vault storage.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 from dataclasses import dataclass, field
@@ -29,6 +30,21 @@ from app.utils.formats import detect_mime_type, extension_to_mime
 
 logger = logging.getLogger(__name__)
 
+_DEGREES_PER_MINUTE = 1.0 / 60.0
+_DEGREES_PER_SECOND = 1.0 / 3600.0
+
+
+def _dms_to_decimal(dms: tuple, ref: str) -> float:
+    """Convert EXIF degrees/minutes/seconds to signed decimal degrees.
+
+    Each IFDRational is converted with float() up front, so the sum is
+    plain float math rather than Fraction arithmetic.
+    """
+    decimal = float(dms[0]) + float(dms[1]) * _DEGREES_PER_MINUTE
+    if len(dms) > 2:
+        decimal += float(dms[2]) * _DEGREES_PER_SECOND
+    return -decimal if ref in ("S", "W") else decimal
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -119,8 +135,10 @@ class IngestionService:
         longitude: float | None = None
         exif_metadata: dict | None = None
         if content_type == "photo":
-            latitude, longitude = self._extract_gps_from_exif(file_data)
-            exif_metadata = self._extract_exif_metadata(file_data)
+            # Pillow parsing is blocking; keep it off the event loop
+            latitude, longitude, exif_metadata = await asyncio.to_thread(
+                self._extract_photo_exif, file_data
+            )
 
         # 2. Preserve to archival format
         try:
@@ -284,23 +302,53 @@ class IngestionService:
             text_extract_envelope=None,
         )
 
-    @staticmethod
-    def _extract_gps_from_exif(file_data: bytes) -> tuple[float | None, float | None]:
+    @classmethod
+    def _extract_photo_exif(
+        cls, file_data: bytes
+    ) -> tuple[float | None, float | None, dict | None]:
+        """Return (latitude, longitude, exif_metadata) for a photo.
+
+        Bundles both blocking EXIF readers so async callers need a single
+        asyncio.to_thread() hop.
+        """
+        latitude, longitude = cls._extract_gps_from_exif(file_data)
+        return (latitude, longitude, cls._extract_exif_metadata(file_data))
+
+    # Leading bytes of the image containers Pillow can read EXIF from
+    _TIFF_MAGICS = (b"II*\x00", b"MM\x00*")
+
+    @classmethod
+    def _may_carry_exif(cls, file_data: bytes) -> bool:
+        """Cheap magic-number check run before handing bytes to Pillow.
+
+        Accepts JPEG, TIFF, PNG, WebP and ISO-BMFF (HEIF/AVIF) headers;
+        anything else cannot hold EXIF, so plugin probing is skipped.
+        """
+        head = file_data[:12]
+        return (
+            head.startswith(b"\xff\xd8\xff")
+            or head[:4] in cls._TIFF_MAGICS
+            or head.startswith(b"\x89PNG\r\n\x1a\n")
+            or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+            or head[4:8] == b"ftyp"
+        )
+
+    @classmethod
+    def _extract_gps_from_exif(cls, file_data: bytes) -> tuple[float | None, float | None]:
         """Extract GPS latitude and longitude from EXIF data.
 
         Returns (latitude, longitude) as decimal degrees, or (None, None)
         if no GPS data is found or the image cannot be read.
 
-        Uses Pillow's Image.getexif() and the GPSInfo IFD tag.
+        Uses Pillow's lazy Image.getexif() and decodes only the GPSInfo IFD;
+        get_ifd() returns an empty dict when there is no EXIF at all.
         """
+        if not cls._may_carry_exif(file_data):
+            return (None, None)
         try:
             with Image.open(io.BytesIO(file_data)) as img:
-                exif = img.getexif()
-                if not exif:
-                    return (None, None)
-
                 # GPS info is stored in a sub-IFD accessed via tag 0x8825 (ExifTags.GPSInfo)
-                gps_ifd = exif.get_ifd(ExifTags.GPSInfo)
+                gps_ifd = img.getexif().get_ifd(ExifTags.GPSInfo)
                 if not gps_ifd:
                     logger.debug("No GPS IFD found in EXIF data (photo has no embedded location)")
                     return (None, None)
@@ -324,16 +372,6 @@ class IngestionService:
                     )
                     return (None, None)
 
-                def _dms_to_decimal(dms: tuple, ref: str) -> float:
-                    """Convert degrees/minutes/seconds to decimal degrees."""
-                    degrees = float(dms[0])
-                    minutes = float(dms[1])
-                    seconds = float(dms[2]) if len(dms) > 2 else 0.0
-                    decimal = degrees + minutes / 60.0 + seconds / 3600.0
-                    if ref in ("S", "W"):
-                        decimal = -decimal
-                    return decimal
-
                 latitude = _dms_to_decimal(lat_data, lat_ref)
                 longitude = _dms_to_decimal(lon_data, lon_ref)
 
@@ -7,13 +7,16 @@ API if Ollama is unreachable or returns errors.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
+import weakref
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import Literal
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,23 @@ class LLMResponse:
     text: str
     model: str
     total_duration_ms: int | None
-    backend: str  # "ollama" or "fallback"
+    backend: Literal["ollama", "fallback"]
+
+
+async def _aiter_byte_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the non-empty lines of a streamed response as raw bytes.
+
+    Splitting bytes directly skips the str decode that aiter_lines() does;
+    orjson parses bytes as-is.
+    """
+    pending = b""
+    async for chunk in response.aiter_bytes():
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            if line := line.rstrip(b"\r"):
+                yield line
+    if pending := pending.rstrip(b"\r"):
+        yield pending
 
 
 class LLMService:
@@ -43,6 +62,13 @@ class LLMService:
 
     # How long (seconds) to suppress Ollama retries after a failure
     _HEALTH_RECHECK_INTERVAL = 60
+    _HEALTH_RECHECK_INTERVAL_NS = _HEALTH_RECHECK_INTERVAL * 1_000_000_000
+
+    # Head start (seconds) Ollama gets over the fallback when racing them
+    _RACE_FALLBACK_DELAY = 1.0
+
+    # Keepalive pool shared by every request made from one event loop
+    _LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0)
 
     __slots__ = (
         "ollama_url",
@@ -52,7 +78,10 @@ class LLMService:
         "_fallback_api_key",
         "_fallback_model",
         "_ollama_healthy",
-        "_last_ollama_fail_time",
+        "_last_ollama_fail_time_ns",
+        "_race_on_degraded",
+        "_client",
+        "_loop_clients",
     )
 
     def __init__(
@@ -63,6 +92,8 @@ class LLMService:
         fallback_url: str = "",
         fallback_api_key: str = "",
         fallback_model: str = "",
+        race_on_degraded: bool = False,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.ollama_url = ollama_url
         self.model = model
@@ -71,7 +102,35 @@ class LLMService:
         self._fallback_api_key = fallback_api_key
         self._fallback_model = fallback_model or model
         self._ollama_healthy: bool = True
-        self._last_ollama_fail_time: float = 0.0
+        self._last_ollama_fail_time_ns: int = 0
+        self._race_on_degraded = race_on_degraded
+        self._client = client
+        # The background worker runs jobs on short-lived event loops of its
+        # own, and an AsyncClient's connections are bound to the loop that
+        # opened them — so pooled clients are kept per loop.
+        self._loop_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the injected client, or the pooled client for the running loop."""
+        if self._client is not None:
+            return self._client
+        loop = asyncio.get_running_loop()
+        client = self._loop_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self._LIMITS, timeout=self._timeout)
+            self._loop_clients[loop] = client
+        return client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client owned by the running event loop.
+
+        An injected client belongs to the caller and is left open.
+        """
+        client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
     @property
     def has_fallback(self) -> bool:
@@ -86,16 +145,16 @@ class LLMService:
         """
         if self._ollama_healthy:
             return True
-        elapsed = time.monotonic() - self._last_ollama_fail_time
-        if elapsed >= self._HEALTH_RECHECK_INTERVAL:
-            logger.info("Re-checking Ollama health after %.0fs cooldown", elapsed)
+        elapsed_ns = time.monotonic_ns() - self._last_ollama_fail_time_ns
+        if elapsed_ns >= self._HEALTH_RECHECK_INTERVAL_NS:
+            logger.info("Re-checking Ollama health after %.0fs cooldown", elapsed_ns / 1e9)
             return True
         return False
 
     def _mark_ollama_down(self) -> None:
         """Record that Ollama failed, entering cooldown period."""
         self._ollama_healthy = False
-        self._last_ollama_fail_time = time.monotonic()
+        self._last_ollama_fail_time_ns = time.monotonic_ns()
         logger.warning("Ollama marked as unhealthy, will retry after %ds", self._HEALTH_RECHECK_INTERVAL)
 
     def _mark_ollama_up(self) -> None:
@@ -120,6 +179,17 @@ class LLMService:
                 the prompt contains decrypted user content that must not leave
                 the local machine.
         """
+        # Ollama is on probation after a failure: race it against the fallback
+        # rather than waiting out a possible connect timeout.
+        if (
+            self._race_on_degraded
+            and not self._ollama_healthy
+            and not local_only
+            and self.has_fallback
+            and self._should_try_ollama()
+        ):
+            return await self._generate_raced(prompt, system, temperature)
+
         # Try Ollama first (if healthy or cooldown expired)
         if self._should_try_ollama():
             try:
@@ -142,6 +212,57 @@ class LLMService:
 
         raise LLMError("Ollama is unavailable and no fallback is configured")
 
+    async def _generate_raced(
+        self, prompt: str, system: str | None, temperature: float
+    ) -> LLMResponse:
+        """Run Ollama and the fallback concurrently; the first success wins.
+
+        Ollama gets a head start of _RACE_FALLBACK_DELAY seconds, cut short
+        if it fails first. The losing request is cancelled. If the fallback
+        wins, Ollama stays marked down and a new cooldown starts.
+        """
+        ollama_failed = asyncio.Event()
+
+        async def _ollama() -> LLMResponse:
+            try:
+                return await self._generate_ollama(prompt, system, temperature)
+            except Exception:
+                ollama_failed.set()
+                raise
+
+        async def _delayed_fallback() -> LLMResponse:
+            try:
+                await asyncio.wait_for(ollama_failed.wait(), self._RACE_FALLBACK_DELAY)
+            except asyncio.TimeoutError:
+                pass
+            return await self._generate_openai(prompt, system, temperature)
+
+        ollama = asyncio.create_task(_ollama())
+        fallback = asyncio.create_task(_delayed_fallback())
+        pending: set[asyncio.Task[LLMResponse]] = {ollama, fallback}
+        error = LLMError("Both Ollama and the fallback LLM failed")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        if task is ollama:
+                            self._mark_ollama_up()
+                        else:
+                            logger.info("Fallback LLM won the race against degraded Ollama")
+                            self._mark_ollama_down()
+                        return task.result()
+                    if not isinstance(exc, LLMError):
+                        raise exc
+                    if task is ollama:
+                        self._mark_ollama_down()
+                    error = exc
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
     async def _generate_ollama(
         self, prompt: str, system: str | None, temperature: float
     ) -> LLMResponse:
@@ -156,19 +277,19 @@ class LLMService:
             payload["system"] = system
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
-                return LLMResponse(
-                    text=data["response"],
-                    model=data["model"],
-                    total_duration_ms=data.get("total_duration", 0) // 1_000_000,
-                    backend="ollama",
-                )
+            response = await self._get_client().post(
+                f"{self.ollama_url}/api/generate",
+                json=payload,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            return LLMResponse(
+                text=data["response"],
+                model=data["model"],
+                total_duration_ms=data.get("total_duration", 0) // 1_000_000,
+                backend="ollama",
+            )
         except httpx.ConnectError as exc:
             raise LLMError(f"Cannot connect to Ollama at {self.ollama_url}: {exc}") from exc
         except httpx.HTTPStatusError as exc:
@@ -197,22 +318,22 @@ class LLMService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    f"{self._fallback_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
-                text = data["choices"][0]["message"]["content"]
-                model = data.get("model", self._fallback_model)
-                return LLMResponse(
-                    text=text,
-                    model=model,
-                    total_duration_ms=None,
-                    backend="fallback",
-                )
+            response = await self._get_client().post(
+                f"{self._fallback_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            text = data["choices"][0]["message"]["content"]
+            model = data.get("model", self._fallback_model)
+            return LLMResponse(
+                text=text,
+                model=model,
+                total_duration_ms=None,
+                backend="fallback",
+            )
         except httpx.ConnectError as exc:
             raise LLMError(f"Cannot connect to fallback LLM at {self._fallback_url}: {exc}") from exc
         except httpx.HTTPStatusError as exc:
@@ -267,17 +388,15 @@ class LLMService:
         # model into GPU memory before producing the first token.
         stream_timeout = httpx.Timeout(self._timeout, read=max(self._timeout, 300.0))
         try:
-            async with httpx.AsyncClient(timeout=stream_timeout) as client:
-                async with client.stream(
-                    "POST", f"{self.ollama_url}/api/generate", json=payload,
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        chunk = json.loads(line)
-                        if "response" in chunk:
-                            yield chunk["response"]
+            async with self._get_client().stream(
+                "POST", f"{self.ollama_url}/api/generate",
+                json=payload, timeout=stream_timeout,
+            ) as response:
+                response.raise_for_status()
+                async for line in _aiter_byte_lines(response):
+                    chunk = orjson.loads(line)
+                    if "response" in chunk:
+                        yield chunk["response"]
         except httpx.ConnectError as exc:
             raise LLMError(f"Cannot connect to Ollama at {self.ollama_url}: {exc}") from exc
         except httpx.HTTPStatusError as exc:
@@ -306,23 +425,23 @@ class LLMService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                async with client.stream(
-                    "POST", f"{self._fallback_url}/chat/completions",
-                    headers=headers, json=payload,
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line or not line.startswith("data: "):
-                            continue
-                        data_str = line[6:]  # strip "data: " prefix
-                        if data_str.strip() == "[DONE]":
-                            break
-                        chunk = json.loads(data_str)
-                        delta = chunk.get("choices", [{}])[0].get("delta", {})
-                        content = delta.get("content")
-                        if content:
-                            yield content
+            async with self._get_client().stream(
+                "POST", f"{self._fallback_url}/chat/completions",
+                headers=headers, json=payload, timeout=self._timeout,
+            ) as response:
+                response.raise_for_status()
+                async for line in _aiter_byte_lines(response):
+                    # SSE field: "data:" plus at most one optional space
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].removeprefix(b" ")
+                    if data.strip() == b"[DONE]":
+                        break
+                    chunk = orjson.loads(data)
+                    delta = chunk.get("choices", [{}])[0].get("delta", {})
+                    content = delta.get("content")
+                    if content:
+                        yield content
         except httpx.ConnectError as exc:
             raise LLMError(f"Cannot connect to fallback LLM at {self._fallback_url}: {exc}") from exc
         except httpx.HTTPStatusError as exc:
@@ -335,9 +454,10 @@ class LLMService:
     async def check_health(self) -> bool:
         """Check if Ollama is reachable by querying /api/tags."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                return response.status_code == 200
+            response = await self._get_client().get(
+                f"{self.ollama_url}/api/tags", timeout=10.0,
+            )
+            return response.status_code == 200
         except (httpx.ConnectError, httpx.HTTPError):
             return False
 
@@ -347,22 +467,22 @@ class LLMService:
             return False
         try:
             headers = {"Authorization": f"Bearer {self._fallback_api_key}"}
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self._fallback_url}/models", headers=headers,
-                )
-                return response.status_code == 200
+            response = await self._get_client().get(
+                f"{self._fallback_url}/models", headers=headers, timeout=10.0,
+            )
+            return response.status_code == 200
         except (httpx.ConnectError, httpx.HTTPError):
             return False
 
     async def ensure_model(self) -> bool:
         """Check if the configured model is available in Ollama."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                models = data.get("models", [])
-                return any(m.get("name") == self.model for m in models)
+            response = await self._get_client().get(
+                f"{self.ollama_url}/api/tags", timeout=10.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+            models = data.get("models", [])
+            return any(m.get("name") == self.model for m in models)
         except (httpx.ConnectError, httpx.HTTPError):
             return False
@@ -64,11 +64,13 @@ def aes_gcm_encrypt(key: bytes, plaintext: bytes, aad: bytes | None = None) -> b
 def aes_gcm_decrypt(key: bytes, data: bytes, aad: bytes | None = None) -> bytes:
     """Decrypt data produced by aes_gcm_encrypt.
 
-    Splits data into nonce (first 12 bytes) and ciphertext+tag.
-    Raises cryptography.exceptions.InvalidTag on tampered data.
+    Splits data into nonce (first 12 bytes) and ciphertext+tag using
+    zero-copy memoryview slices. Raises cryptography.exceptions.InvalidTag
+    on tampered data.
     """
-    nonce = data[:12]
-    ciphertext = data[12:]
+    view = memoryview(data)
+    nonce = view[:12]
+    ciphertext = view[12:]
     aesgcm = AESGCM(key)
     return aesgcm.decrypt(nonce, ciphertext, aad)
 
@@ -115,6 +115,20 @@ class BackgroundWorker:
         self._queue.put(job)
         logger.debug("Job submitted: %s", job.job_type.value)
 
+    def _close_job_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a per-job event loop, first releasing the LLM client pooled on it.
+
+        LLMService keeps one HTTP client per event loop; its keepalive
+        connections reference the loop, so without an explicit close each
+        job would leak a loop, a client and an open socket.
+        """
+        try:
+            loop.run_until_complete(self._llm_service.close())
+        except Exception:
+            logger.debug("Failed to close LLM client for job loop", exc_info=True)
+        finally:
+            loop.close()
+
     def _get_engine(self):
         """Get the DB engine (deferred import to avoid circular imports)."""
         from app.db import engine
@@ -473,7 +487,7 @@ class BackgroundWorker:
                     retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     def _auto_suggest_tags(
         self,
@@ -766,7 +780,7 @@ class BackgroundWorker:
                     retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     def _build_vault_service(self):
         """Construct a VaultService from settings (same as dependencies.get_vault_service)."""
@@ -1052,7 +1066,7 @@ class BackgroundWorker:
                     next_attempt, max_attempts, retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     def _find_untagged_memory_ids(self, engine, limit: int = 20) -> list[str]:
         """Find memory IDs that have zero tags."""
@@ -1320,7 +1334,7 @@ class BackgroundWorker:
                     next_attempt, max_attempts, retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     def _find_enrichable_memory_ids(self, engine, limit: int = 5) -> list[str]:
         """Find candidate memory IDs for enrichment prompts.
@@ -1629,7 +1643,7 @@ class BackgroundWorker:
                     next_attempt, max_attempts, retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     # ------------------------------------------------------------------
     # Person Auto-Link
@@ -1769,7 +1783,7 @@ class BackgroundWorker:
                     next_attempt, max_attempts, retry_at.isoformat(),
                 )
         finally:
-            loop.close()
+            self._close_job_loop(loop)
 
     def _find_person_unlinked_memory_ids(self, engine, limit: int = 30) -> list[str]:
         """Find memory IDs that haven't been processed for person auto-linking.
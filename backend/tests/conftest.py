@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
 from pathlib import Path
@@ -17,9 +18,13 @@ os.environ.setdefault("JWT_SECRET", "test-jwt-secret-for-integration-tests-only"
 
 import base64
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from pytest_asyncio import is_async_test
 from pyrage import x25519
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, Session, create_engine
 
@@ -39,6 +44,41 @@ from app.services.llm import LLMService, LLMResponse
 from app.services.preservation import PreservationService
 from app.services.vault import VaultService
 from app.utils.crypto import derive_master_key, hmac_sha256
+from tests.fakes import FakeRoutes
+
+
+# ── Event loop ────────────────────────────────────────────────────────
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run every async test in one session-wide event loop.
+
+    pytest-asyncio otherwise creates and closes a loop per test.
+
+    When pytest-xdist is installed, also put each test class (or a module's
+    top-level tests) in one xdist group, so ``-n auto --dist loadgroup``
+    keeps a class and its parametrized cases on one worker.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    with_xdist = config.pluginmanager.hasplugin("xdist")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if with_xdist:
+            group = item.nodeid.split("::")[0]
+            if item.cls is not None:
+                group = f"{group}::{item.cls.__name__}"
+            item.add_marker(pytest.mark.xdist_group(group))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop for the test loop when available (uvicorn[standard] ships it)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 # ── Database fixtures ─────────────────────────────────────────────────
@@ -49,7 +89,9 @@ def engine_fixture():
     """Create an in-memory SQLite engine for testing.
 
     Uses StaticPool so every connection shares the same in-memory database.
-    Recreates tables per test for full isolation.
+    Recreates tables per test for full isolation. No drop_all at teardown:
+    disposing the engine closes its only connection, which frees the
+    database.
     """
     engine = create_engine(
         "sqlite://",
@@ -58,11 +100,6 @@ def engine_fixture():
     )
     SQLModel.metadata.create_all(engine)
     yield engine
-    # Disable FK constraints before dropping to avoid ordering issues
-    with engine.connect() as conn:
-        conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
-        conn.commit()
-    SQLModel.metadata.drop_all(engine)
     engine.dispose()
 
 
@@ -73,6 +110,48 @@ def session_fixture(engine):
         yield session
 
 
+@pytest.fixture(name="module_engine", scope="module")
+def module_engine_fixture():
+    """One in-memory engine per test module; tables are created once.
+
+    pysqlite's implicit transaction handling breaks SAVEPOINT rollbacks, so
+    BEGIN is emitted explicitly (SQLAlchemy's documented SQLite recipe).
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="savepoint_session")
+def savepoint_session_fixture(module_engine):
+    """Per-test session whose commits are SAVEPOINTs rolled back at teardown.
+
+    Modules opt in by overriding ``session`` with this fixture, trading the
+    per-test schema rebuild for a rollback.
+    """
+    with module_engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        transaction.rollback()
+
+
 # ── HTTP client fixtures ──────────────────────────────────────────────
 
 
@@ -161,15 +240,18 @@ def auth_client_fixture(session, test_passphrase, test_salt):
 # ── Encryption fixtures ───────────────────────────────────────────────
 
 
-@pytest.fixture(name="master_key")
+@pytest.fixture(name="master_key", scope="session")
 def master_key_fixture() -> bytes:
-    """Deterministic test master key for encryption tests."""
+    """Random test master key, generated once per test session.
+
+    Immutable bytes; auth_state copies keys before wiping, so sharing is safe.
+    """
     return os.urandom(32)
 
 
-@pytest.fixture(name="encryption_service")
+@pytest.fixture(name="encryption_service", scope="session")
 def encryption_service_fixture(master_key: bytes) -> EncryptionService:
-    """Pre-initialized EncryptionService for unit tests."""
+    """Pre-initialized EncryptionService, built once (HKDF runs once)."""
     return EncryptionService(master_key)
 
 
@@ -182,9 +264,12 @@ def vault_dir_fixture(tmp_path: Path) -> Path:
     return tmp_path / "vault"
 
 
-@pytest.fixture(name="identity")
+@pytest.fixture(name="identity", scope="session")
 def identity_fixture() -> x25519.Identity:
-    """Fresh age identity for vault tests."""
+    """Age identity for vault tests, generated once per session.
+
+    Each test still gets its own vault_dir, so no ciphertext is shared.
+    """
     return x25519.Identity.generate()
 
 
@@ -197,11 +282,10 @@ def vault_service_fixture(vault_dir: Path, identity: x25519.Identity) -> VaultSe
 # ── Ingestion fixtures ────────────────────────────────────────────────
 
 
-@pytest.fixture(name="preservation_service")
-def preservation_service_fixture(tmp_path: Path) -> PreservationService:
-    d = tmp_path / "pres_tmp"
-    d.mkdir(exist_ok=True)
-    return PreservationService(tmp_dir=d)
+@pytest.fixture(name="preservation_service", scope="session")
+def preservation_service_fixture(tmp_path_factory) -> PreservationService:
+    """Shared PreservationService; it holds no state beyond its scratch dir."""
+    return PreservationService(tmp_dir=tmp_path_factory.mktemp("pres_tmp"))
 
 
 @pytest.fixture(name="ingestion_service")
@@ -240,9 +324,44 @@ def mock_llm_service_fixture() -> MagicMock:
         )
     )
     mock.healthy = AsyncMock(return_value=True)
+    mock.close = AsyncMock()
     return mock
 
 
+@pytest.fixture(name="mock_httpx")
+def mock_httpx_fixture(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Make every ``httpx.AsyncClient(...)`` return one AsyncMock client.
+
+    The mock is its own async context manager, so code using
+    ``async with httpx.AsyncClient() as client`` gets the same object.
+    Set ``mock_httpx.post.return_value`` etc. to script responses.
+    """
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = False
+    monkeypatch.setattr("httpx.AsyncClient", MagicMock(return_value=client))
+    return client
+
+
+# ── Fake HTTP server fixtures ─────────────────────────────────────────
+
+
+@pytest.fixture(name="fake_routes", scope="module")
+def fake_routes_fixture() -> FakeRoutes:
+    return FakeRoutes()
+
+
+@pytest_asyncio.fixture(name="http_client", scope="module", loop_scope="session")
+async def http_client_fixture(fake_routes: FakeRoutes):
+    """One real httpx client, served by ``fake_routes``, shared by a module.
+
+    Pinned to the session loop the tests run in, so the pool's connections
+    never outlive the loop that created them.
+    """
+    async with httpx.AsyncClient(transport=httpx.MockTransport(fake_routes)) as client:
+        yield client
+
+
 # ── Ingest-ready auth client ──────────────────────────────────────────
 
 
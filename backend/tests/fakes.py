@@ -0,0 +1,35 @@
+"""Test doubles shared across test modules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import httpx
+
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeRoutes:
+    """Fake HTTP server behind the shared ``http_client``'s MockTransport.
+
+    Tests register handlers in ``routes`` keyed by exact URL path; any
+    other path gets a 404. Every request received is kept in ``requests``.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Handler] = {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.routes.get(request.url.path, _not_found)(request)
+
+    def reset(self) -> None:
+        """Forget registered handlers and recorded requests."""
+        self.routes.clear()
+        self.requests.clear()
+
+
+def _not_found(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(404)
@@ -23,6 +23,10 @@ from app.services.embedding import (
 from app.services.encryption import EncryptionService
 
 
+# Request attached to canned responses, so raise_for_status() can run.
+_EMBED_REQUEST = httpx.Request("POST", "http://fake-ollama:11434/api/embed")
+
+
 # ── Fixtures ──────────────────────────────────────────────────────────
 
 
@@ -122,62 +126,39 @@ class TestGetEmbedding:
 
     @pytest.mark.asyncio
     async def test_returns_768_dim_vector(
-        self, embedding_service: EmbeddingService, fake_embedding: list[float]
+        self,
+        embedding_service: EmbeddingService,
+        fake_embedding: list[float],
+        mock_httpx: AsyncMock,
     ) -> None:
         """Mock Ollama returns a 768-dim vector."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"embeddings": [fake_embedding]}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await embedding_service._get_embedding("test text")
-            assert len(result) == 768
-            assert result == fake_embedding
+        mock_httpx.post.return_value = httpx.Response(
+            200, json={"embeddings": [fake_embedding]}, request=_EMBED_REQUEST
+        )
+
+        result = await embedding_service._get_embedding("test text")
+        assert len(result) == 768
+        assert result == fake_embedding
 
     @pytest.mark.asyncio
     async def test_ollama_unreachable(
-        self, embedding_service: EmbeddingService
+        self, embedding_service: EmbeddingService, mock_httpx: AsyncMock
     ) -> None:
         """Ollama connection error raises EmbeddingError."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_httpx.post.side_effect = httpx.ConnectError("Connection refused")
 
-            with pytest.raises(EmbeddingError, match="Cannot connect"):
-                await embedding_service._get_embedding("test")
+        with pytest.raises(EmbeddingError, match="Cannot connect"):
+            await embedding_service._get_embedding("test")
 
     @pytest.mark.asyncio
     async def test_ollama_error_response(
-        self, embedding_service: EmbeddingService
+        self, embedding_service: EmbeddingService, mock_httpx: AsyncMock
     ) -> None:
         """Ollama HTTP 500 raises EmbeddingError."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=mock_response,
-        )
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_httpx.post.return_value = httpx.Response(500, request=_EMBED_REQUEST)
 
-            with pytest.raises(EmbeddingError, match="Ollama returned HTTP"):
-                await embedding_service._get_embedding("test")
+        with pytest.raises(EmbeddingError, match="Ollama returned HTTP"):
+            await embedding_service._get_embedding("test")
 
 
 # ── TestEnsureCollection ──────────────────────────────────────────────
@@ -139,6 +139,14 @@ class TestAesGcm:
         data = aes_gcm_encrypt(key, b"")
         assert aes_gcm_decrypt(key, data) == b""
 
+    def test_decrypt_accepts_buffer(self) -> None:
+        """Decrypt accepts any bytes-like input and returns bytes."""
+        key = generate_dek()
+        data = aes_gcm_encrypt(key, b"buffered")
+        result = aes_gcm_decrypt(key, bytearray(data))
+        assert result == b"buffered"
+        assert isinstance(result, bytes)
+
 
 class TestGenerateDek:
     def test_length(self) -> None:
@@ -348,6 +356,16 @@ class TestEncryptedEnvelope:
         with pytest.raises(AttributeError):
             envelope.ciphertext = b"modified"  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        """EncryptedEnvelope uses __slots__, so instances carry no __dict__."""
+        envelope = EncryptedEnvelope(
+            ciphertext=b"ct",
+            encrypted_dek=b"dek",
+            algo="aes-256-gcm",
+            version=1,
+        )
+        assert not hasattr(envelope, "__dict__")
+
 
 class TestEdgeCases:
     def test_large_plaintext(self, encryption_service: EncryptionService) -> None:
@@ -46,10 +46,13 @@ GEDCOM_CONTENT = textwrap.dedent("""\
 """)
 
 
-@pytest.fixture(name="gedcom_file")
-def gedcom_file_fixture(tmp_path: Path) -> Path:
-    """Write a minimal valid GEDCOM 5.5 file and return its path."""
-    path = tmp_path / "test.ged"
+@pytest.fixture(name="gedcom_file", scope="session")
+def gedcom_file_fixture(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a minimal valid GEDCOM 5.5 file once and return its path.
+
+    The importer only reads the file, so every test can share one copy.
+    """
+    path = tmp_path_factory.mktemp("gedcom") / "test.ged"
     path.write_text(GEDCOM_CONTENT, encoding="utf-8")
     return path
 
@@ -136,6 +139,22 @@ def test_import_sets_relationships(session: Session, gedcom_file: Path) -> None:
     assert by_gedcom["@I7@"].relationship_to_owner == "sibling"
 
 
+def test_import_sets_grandparent_relationships(session: Session, gedcom_file: Path) -> None:
+    """Relationships two generations away are resolved; others fall back to "other"."""
+    import_gedcom_file(gedcom_file, session, owner_gedcom_id="@I3@")
+
+    persons = session.exec(select(Person)).all()
+    by_gedcom = {p.gedcom_id: p for p in persons}
+
+    assert by_gedcom["@I3@"].relationship_to_owner == "self"
+    assert by_gedcom["@I1@"].relationship_to_owner == "parent"
+    assert by_gedcom["@I2@"].relationship_to_owner == "parent"
+    assert by_gedcom["@I4@"].relationship_to_owner == "sibling"
+    assert by_gedcom["@I5@"].relationship_to_owner == "grandparent"
+    assert by_gedcom["@I6@"].relationship_to_owner == "grandparent"
+    assert by_gedcom["@I7@"].relationship_to_owner == "other"
+
+
 def test_import_marks_deceased(session: Session, gedcom_file: Path) -> None:
     """Persons with a DEAT tag in GEDCOM are marked is_deceased=True."""
     import_gedcom_file(gedcom_file, session)
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import os
-import time
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import reverse_geocoder as rg
 
+from app.services.encryption import EncryptionService
 from app.services.geocoding import GeocodingResult, GeocodingService
 
 
@@ -62,16 +62,35 @@ def test_reverse_geocode_display_name_format():
     assert len(parts) >= 2  # At least city + country code
 
 
-def test_reverse_geocode_and_encrypt():
-    """reverse_geocode_and_encrypt returns encrypted place name that can be decrypted."""
-    from app.services.encryption import EncryptedEnvelope, EncryptionService
+@pytest.mark.parametrize(
+    ("record", "expected_display", "expected_city"),
+    [
+        ({"name": "Berlin", "admin1": "Berlin", "cc": "DE"}, "Berlin, Berlin, DE", "Berlin"),
+        ({"name": "Smalltown", "admin1": "", "cc": "TC"}, "Smalltown, TC", "Smalltown"),
+        ({"name": "", "admin1": "", "cc": "TC"}, "TC", ""),
+        ({}, "1.5, 2.5", None),
+    ],
+    ids=["city_state_country", "city_country", "country_only", "fallback_coords"],
+)
+def test_reverse_geocode_display_name_shapes(record, expected_display, expected_city):
+    """Display name joins whichever of city/state/country the lookup returns."""
+    svc = GeocodingService(enabled=True)
 
-    master_key = os.urandom(32)
-    enc = EncryptionService(master_key)
+    with patch("app.services.geocoding.rg.search", return_value=[record]):
+        result = svc.reverse_geocode(1.5, 2.5)
+
+    assert result is not None
+    assert result.display_name == expected_display
+    assert result.city == expected_city
+
+
+def test_reverse_geocode_and_encrypt(encryption_service):
+    """reverse_geocode_and_encrypt returns encrypted place name that can be decrypted."""
+    from app.services.encryption import EncryptedEnvelope
 
     svc = GeocodingService(enabled=True)
 
-    result = svc.reverse_geocode_and_encrypt(52.52, 13.405, enc)
+    result = svc.reverse_geocode_and_encrypt(52.52, 13.405, encryption_service)
 
     assert result is not None
     place_name_hex, place_name_dek_hex = result
@@ -83,22 +102,20 @@ def test_reverse_geocode_and_encrypt():
         algo="aes-256-gcm",
         version=1,
     )
-    plaintext = enc.decrypt(envelope).decode("utf-8")
+    plaintext = encryption_service.decrypt(envelope).decode("utf-8")
     assert len(plaintext) > 0
     assert "," in plaintext  # "City, State, CC" format
 
 
 def test_reverse_geocode_and_encrypt_disabled():
-    """reverse_geocode_and_encrypt returns None when geocoding is disabled."""
-    from app.services.encryption import EncryptionService
-
-    master_key = os.urandom(32)
-    enc = EncryptionService(master_key)
-
+    """When disabled, returns None without touching the encryption service."""
+    enc = MagicMock(spec=EncryptionService)
     svc = GeocodingService(enabled=False)
 
     result = svc.reverse_geocode_and_encrypt(52.52, 13.405, enc)
+
     assert result is None
+    enc.encrypt.assert_not_called()
 
 
 def test_reverse_geocode_error_returns_none():
@@ -111,6 +128,42 @@ def test_reverse_geocode_error_returns_none():
     assert result is None
 
 
+def test_reverse_geocode_caches_nearby_coordinates():
+    """Coordinates that round to the same key reuse the cached result."""
+    svc = GeocodingService(enabled=True)
+
+    with patch("app.services.geocoding.rg.search", wraps=rg.search) as mock_search:
+        first = svc.reverse_geocode(52.52, 13.405)
+        second = svc.reverse_geocode(52.520001, 13.405001)
+
+    assert first is not None
+    assert second is first
+    mock_search.assert_called_once()
+
+
+def test_reverse_geocode_cache_is_bounded(monkeypatch):
+    """The least recently used entry is evicted once the cache is full."""
+    svc = GeocodingService(enabled=True)
+    monkeypatch.setattr(svc, "REVERSE_CACHE_SIZE", 2)
+
+    svc.reverse_geocode(52.52, 13.405)  # Berlin
+    svc.reverse_geocode(48.8566, 2.3522)  # Paris
+    svc.reverse_geocode(52.52, 13.405)  # Berlin becomes most recent
+    svc.reverse_geocode(40.7487, -73.9853)  # NYC evicts Paris
+
+    assert list(svc._reverse_cache) == [(52.52, 13.405), (40.7487, -73.9853)]
+
+
+def test_reverse_geocode_failure_not_cached():
+    """Failed lookups are retried rather than cached."""
+    svc = GeocodingService(enabled=True)
+
+    with patch("app.services.geocoding.rg.search", side_effect=RuntimeError("boom")):
+        assert svc.reverse_geocode(52.52, 13.405) is None
+
+    assert svc.reverse_geocode(52.52, 13.405) is not None
+
+
 # ---------------------------------------------------------------------------
 # Forward geocoding (async, Nominatim)
 # ---------------------------------------------------------------------------
@@ -130,22 +183,38 @@ NOMINATIM_SEARCH_RESULTS = [
     {"display_name": "Berlin, MD, USA", "lat": "38.32", "lon": "-75.22"},
 ]
 
+# Built once: the service only reads status and JSON body, so it is reusable.
+NOMINATIM_SEARCH_RESPONSE = _mock_response(NOMINATIM_SEARCH_RESULTS)
 
-@pytest.mark.asyncio
-async def test_forward_geocode_success():
-    """Forward geocode returns results from Nominatim."""
+
+@pytest.fixture(name="shared_geocoding_svc", scope="module")
+def shared_geocoding_svc_fixture() -> GeocodingService:
+    """One enabled GeocodingService with a mocked HTTP client per module."""
     svc = GeocodingService(enabled=True)
     svc._client = AsyncMock()
-    svc._client.get = AsyncMock(return_value=_mock_response(NOMINATIM_SEARCH_RESULTS))
+    return svc
 
-    results = await svc.forward_geocode("Berlin")
+
+@pytest.fixture(name="geocoding_svc")
+def geocoding_svc_fixture(shared_geocoding_svc: GeocodingService) -> GeocodingService:
+    """The shared service with its rate-limit state reset for this test."""
+    shared_geocoding_svc._last_request_time = 0.0
+    return shared_geocoding_svc
+
+
+@pytest.mark.asyncio
+async def test_forward_geocode_success(geocoding_svc):
+    """Forward geocode returns results from Nominatim."""
+    geocoding_svc._client.get = AsyncMock(
+        return_value=NOMINATIM_SEARCH_RESPONSE
+    )
+
+    results = await geocoding_svc.forward_geocode("Berlin")
 
     assert len(results) == 2
     assert results[0]["display_name"] == "Berlin, Germany"
     assert results[0]["lat"] == "52.52"
 
-    await svc.close()
-
 
 @pytest.mark.asyncio
 async def test_forward_geocode_disabled():
@@ -160,35 +229,38 @@ async def test_forward_geocode_disabled():
 
 
 @pytest.mark.asyncio
-async def test_forward_geocode_network_error():
+async def test_forward_geocode_network_error(geocoding_svc):
     """Network error returns empty list (never raises)."""
-    svc = GeocodingService(enabled=True)
-    svc._client = AsyncMock()
-    svc._client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+    geocoding_svc._client.get = AsyncMock(
+        side_effect=httpx.ConnectError("Connection refused")
+    )
 
-    results = await svc.forward_geocode("Berlin")
+    results = await geocoding_svc.forward_geocode("Berlin")
 
     assert results == []
 
-    await svc.close()
-
 
 @pytest.mark.asyncio
-async def test_forward_geocode_rate_limiting():
-    """Two rapid forward geocode calls respect rate limiting."""
-    svc = GeocodingService(enabled=True)
-    svc.MIN_REQUEST_INTERVAL = 0.2
-    svc._client = AsyncMock()
-    svc._client.get = AsyncMock(return_value=_mock_response(NOMINATIM_SEARCH_RESULTS))
+async def test_forward_geocode_rate_limiting(geocoding_svc):
+    """A second call inside MIN_REQUEST_INTERVAL sleeps for the remainder."""
+    geocoding_svc._client.get = AsyncMock(
+        return_value=NOMINATIM_SEARCH_RESPONSE
+    )
 
-    start = time.monotonic()
-    await svc.forward_geocode("Berlin")
-    await svc.forward_geocode("Paris")
-    elapsed = time.monotonic() - start
+    with (
+        patch("app.services.geocoding.time") as mock_time,
+        patch("app.services.geocoding.asyncio") as mock_asyncio,
+    ):
+        # Each call reads the clock twice: before and after the wait.
+        mock_time.monotonic.side_effect = [100.0, 100.0, 100.25, 101.0]
+        mock_asyncio.sleep = AsyncMock()
 
-    assert elapsed >= 0.15  # Small margin for timing
+        await geocoding_svc.forward_geocode("Berlin")
+        await geocoding_svc.forward_geocode("Paris")
 
-    await svc.close()
+    mock_asyncio.sleep.assert_awaited_once()
+    slept = mock_asyncio.sleep.await_args.args[0]
+    assert slept == pytest.approx(geocoding_svc.MIN_REQUEST_INTERVAL - 0.25)
 
 
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -7,6 +8,22 @@ import pytest
 from app.services.git_ops import GitOpsService
 
 
+@pytest.fixture(name="git_template", scope="session")
+def git_template_fixture(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize a git repo once; tests copy it instead of running git init."""
+    template = tmp_path_factory.mktemp("git-template") / "git"
+    GitOpsService(template)
+    return template
+
+
+@pytest.fixture(name="svc")
+def svc_fixture(tmp_path: Path, git_template: Path) -> GitOpsService:
+    """GitOpsService over a fresh copy of the template repo at tmp_path/git."""
+    git_root = tmp_path / "git"
+    shutil.copytree(git_template, git_root)
+    return GitOpsService(git_root)
+
+
 def test_init_creates_repo(tmp_path: Path) -> None:
     """Initializing GitOpsService creates a git repo with subdirectories."""
     git_root = tmp_path / "git"
@@ -17,19 +34,17 @@ def test_init_creates_repo(tmp_path: Path) -> None:
     assert (git_root / "connections").is_dir()
 
 
-def test_commit_memory_creates_file_and_returns_sha(tmp_path: Path) -> None:
+def test_commit_memory_creates_file_and_returns_sha(svc: GitOpsService, tmp_path: Path) -> None:
     """Commit a memory, verify file on disk and valid SHA."""
-    svc = GitOpsService(tmp_path / "git")
     sha = svc.commit_memory("mem-001", "encrypted-content-v1")
 
     assert len(sha) == 40
-    assert all(c in "0123456789abcdef" for c in sha)
+    assert bytes.fromhex(sha).hex() == sha  # lowercase hex, checked in C
     assert (tmp_path / "git" / "memories" / "mem-001.md").read_text() == "encrypted-content-v1"
 
 
-def test_commit_memory_unchanged_content_returns_sha(tmp_path: Path) -> None:
+def test_commit_memory_unchanged_content_returns_sha(svc: GitOpsService) -> None:
     """Committing same content twice is idempotent (no error)."""
-    svc = GitOpsService(tmp_path / "git")
     sha1 = svc.commit_memory("mem-002", "same-content")
     sha2 = svc.commit_memory("mem-002", "same-content")
 
@@ -39,9 +54,8 @@ def test_commit_memory_unchanged_content_returns_sha(tmp_path: Path) -> None:
     assert sha1 == sha2
 
 
-def test_commit_memory_update_creates_new_commit(tmp_path: Path) -> None:
+def test_commit_memory_update_creates_new_commit(svc: GitOpsService) -> None:
     """Committing updated content creates a distinct commit."""
-    svc = GitOpsService(tmp_path / "git")
     sha1 = svc.commit_memory("mem-003", "version-1")
     sha2 = svc.commit_memory("mem-003", "version-2")
 
@@ -49,9 +63,8 @@ def test_commit_memory_update_creates_new_commit(tmp_path: Path) -> None:
     assert len(sha2) == 40
 
 
-def test_get_memory_history(tmp_path: Path) -> None:
+def test_get_memory_history(svc: GitOpsService) -> None:
     """Commit 3 versions, verify history returns 3 entries (newest first)."""
-    svc = GitOpsService(tmp_path / "git")
     svc.commit_memory("mem-004", "v1", message="First version")
     svc.commit_memory("mem-004", "v2", message="Second version")
     svc.commit_memory("mem-004", "v3", message="Third version")
@@ -70,9 +83,8 @@ def test_get_memory_history(tmp_path: Path) -> None:
         assert "author" in entry
 
 
-def test_get_memory_at_commit(tmp_path: Path) -> None:
+def test_get_memory_at_commit(svc: GitOpsService) -> None:
     """Retrieve content at a previous commit SHA."""
-    svc = GitOpsService(tmp_path / "git")
     sha1 = svc.commit_memory("mem-005", "original-content")
     svc.commit_memory("mem-005", "updated-content")
 
@@ -80,9 +92,8 @@ def test_get_memory_at_commit(tmp_path: Path) -> None:
     assert content == "original-content"
 
 
-def test_delete_memory_file(tmp_path: Path) -> None:
+def test_delete_memory_file(svc: GitOpsService, tmp_path: Path) -> None:
     """Create then delete a memory file, verify removal and commit."""
-    svc = GitOpsService(tmp_path / "git")
     svc.commit_memory("mem-006", "to-be-deleted")
     assert (tmp_path / "git" / "memories" / "mem-006.md").exists()
 
@@ -92,28 +103,40 @@ def test_delete_memory_file(tmp_path: Path) -> None:
     assert not (tmp_path / "git" / "memories" / "mem-006.md").exists()
 
 
-def test_delete_nonexistent_memory_returns_none(tmp_path: Path) -> None:
+def test_delete_nonexistent_memory_returns_none(svc: GitOpsService) -> None:
     """Deleting a memory that was never committed returns None."""
-    svc = GitOpsService(tmp_path / "git")
     result = svc.delete_memory_file("does-not-exist")
     assert result is None
 
 
-def test_commit_connection(tmp_path: Path) -> None:
+def test_commit_memories_single_commit(svc: GitOpsService, tmp_path: Path) -> None:
+    """commit_memories writes every file and records them in one commit."""
+    sha = svc.commit_memories(
+        {"mem-x": "content-x", "mem-y": "content-y"}, message="Batch import"
+    )
+
+    assert len(sha) == 40
+    assert bytes.fromhex(sha).hex() == sha
+    assert (tmp_path / "git" / "memories" / "mem-x.md").read_text() == "content-x"
+    assert (tmp_path / "git" / "memories" / "mem-y.md").read_text() == "content-y"
+    for memory_id in ("mem-x", "mem-y"):
+        history = svc.get_memory_history(memory_id)
+        assert [entry["sha"] for entry in history] == [sha]
+        assert history[0]["message"] == "Batch import"
+
+
+def test_commit_connection(svc: GitOpsService, tmp_path: Path) -> None:
     """Verify connections are stored in connections/ subdirectory."""
-    svc = GitOpsService(tmp_path / "git")
     sha = svc.commit_connection("conn-001", "connection-data")
 
     assert len(sha) == 40
     assert (tmp_path / "git" / "connections" / "conn-001.md").read_text() == "connection-data"
 
 
-def test_multiple_memories_independent(tmp_path: Path) -> None:
+def test_multiple_memories_independent(svc: GitOpsService) -> None:
     """Two different memories have independent histories."""
-    svc = GitOpsService(tmp_path / "git")
     svc.commit_memory("mem-a", "content-a-v1")
-    svc.commit_memory("mem-a", "content-a-v2")
-    svc.commit_memory("mem-b", "content-b-v1")
+    svc.commit_memories({"mem-a": "content-a-v2", "mem-b": "content-b-v1"})
 
     history_a = svc.get_memory_history("mem-a")
     history_b = svc.get_memory_history("mem-b")
@@ -9,12 +9,21 @@ import pytest
 from sqlmodel import Session, select
 
 from app.config import Settings
-from app.models.heartbeat import Heartbeat, HeartbeatAlert
+from app.main import app as fastapi_app
+from app.models.heartbeat import Heartbeat, HeartbeatAlert, HeartbeatChallenge
+from app.routers.heartbeat import _get_heartbeat_service
+from app.services import heartbeat as heartbeat_module
 from app.services.heartbeat import HeartbeatService
 from app.utils.crypto import hmac_sha256
 
 
-@pytest.fixture()
+@pytest.fixture(name="session")
+def session_fixture(savepoint_session):
+    """Share the module's engine instead of recreating the schema per test."""
+    return savepoint_session
+
+
+@pytest.fixture(scope="module")
 def settings() -> Settings:
     return Settings(
         heartbeat_check_interval_days=30,
@@ -25,11 +34,72 @@ def settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def wrong_key() -> bytes:
+    """A key other than ``master_key``, drawn once for the session."""
+    return os.urandom(32)
+
+
 @pytest.fixture()
 def heartbeat_service(settings: Settings) -> HeartbeatService:
     return HeartbeatService(settings)
 
 
+@pytest.fixture(name="api_heartbeat_service", scope="module")
+def api_heartbeat_service_fixture(settings: Settings) -> HeartbeatService:
+    """One HeartbeatService shared by every API test in the module."""
+    return HeartbeatService(settings)
+
+
+@pytest.fixture(name="heartbeat_api")
+def heartbeat_api_fixture(api_heartbeat_service: HeartbeatService):
+    """Route the heartbeat endpoints to the shared service.
+
+    A dependency override survives the app lifespan, which would otherwise
+    replace ``app.state.heartbeat_service`` when the TestClient starts.
+    """
+    fastapi_app.dependency_overrides[_get_heartbeat_service] = (
+        lambda: api_heartbeat_service
+    )
+    yield api_heartbeat_service
+    fastapi_app.dependency_overrides.pop(_get_heartbeat_service, None)
+
+
+class _Clock:
+    """Controllable stand-in for HeartbeatService._utcnow (naive UTC)."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, *, days: int) -> None:
+        self.now += timedelta(days=days)
+
+
+@pytest.fixture()
+def clock(
+    heartbeat_service: HeartbeatService, monkeypatch: pytest.MonkeyPatch
+) -> _Clock:
+    """Freeze the service's clock so tests can jump forward in time."""
+    fake = _Clock()
+    monkeypatch.setattr(heartbeat_service, "_utcnow", fake)
+    return fake
+
+
+@pytest.fixture()
+def stub_hmac(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the service's HMAC with a cheap deterministic stub.
+
+    For tests that only need a check-in to succeed. Tests of signature
+    verification itself must not use this fixture.
+    """
+    monkeypatch.setattr(
+        heartbeat_module, "hmac_sha256", lambda key, message: message.hex()
+    )
+
+
 # ---------------------------------------------------------------------------
 # helpers
 # ---------------------------------------------------------------------------
@@ -42,9 +112,15 @@ def _do_checkin(
     ip_address: str | None = None,
     user_agent: str | None = None,
 ):
-    """Generate a challenge and complete a valid check-in."""
+    """Generate a challenge and complete a valid check-in.
+
+    Signs with whatever HMAC the service module currently uses, so it also
+    works under the ``stub_hmac`` fixture.
+    """
     challenge_resp = service.generate_challenge(session)
-    response_hmac = hmac_sha256(master_key, challenge_resp.challenge.encode("utf-8"))
+    response_hmac = heartbeat_module.hmac_sha256(
+        master_key, challenge_resp.challenge.encode("utf-8")
+    )
     return service.verify_checkin(
         challenge=challenge_resp.challenge,
         response_hmac=response_hmac,
@@ -55,22 +131,24 @@ def _do_checkin(
     )
 
 
-def _insert_old_heartbeat(session: Session, days_ago: int) -> Heartbeat:
-    """Insert a heartbeat row backdated by *days_ago* days.
-
-    SQLite stores naive datetimes, so we use naive UTC to match what
-    HeartbeatService.verify_checkin writes (datetime.now(timezone.utc)
-    loses the tzinfo when round-tripped through SQLite/SQLModel).
-    """
-    hb = Heartbeat(
-        checked_in_at=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days_ago),
-        challenge=f"test-challenge-{days_ago}",
-        response_hash="test-hash",
+def _add_heartbeats(session: Session, n: int) -> None:
+    """Insert *n* prior check-ins directly, skipping the challenge round-trip."""
+    session.add_all(
+        Heartbeat(challenge=f"prior-{i}", response_hash="") for i in range(n)
     )
-    session.add(hb)
-    session.commit()
-    session.refresh(hb)
-    return hb
+    session.flush()
+
+
+def _checkin_days_ago(
+    service: HeartbeatService,
+    session: Session,
+    master_key: bytes,
+    clock: _Clock,
+    days_ago: int,
+) -> None:
+    """Check in now, then move the service clock forward by *days_ago* days."""
+    _do_checkin(service, session, master_key)
+    clock.advance(days=days_ago)
 
 
 # ===========================================================================
@@ -186,7 +264,6 @@ class TestVerifyCheckin:
     ):
         challenge_resp = heartbeat_service.generate_challenge(session)
         # Force expiry by updating the database row
-        from app.models.heartbeat import HeartbeatChallenge
         db_challenge = session.exec(
             select(HeartbeatChallenge).where(
                 HeartbeatChallenge.challenge == challenge_resp.challenge
@@ -299,6 +376,7 @@ class TestGetStatus:
         assert status.days_since is None
         assert status.is_overdue is False
 
+    @pytest.mark.usefixtures("stub_hmac")
     def test_status_after_checkin(
         self,
         heartbeat_service: HeartbeatService,
@@ -315,17 +393,25 @@ class TestGetStatus:
         assert abs((status.next_due - expected_next).total_seconds()) < 2
 
     def test_status_shows_overdue(
-        self, heartbeat_service: HeartbeatService, session: Session
+        self,
+        heartbeat_service: HeartbeatService,
+        session: Session,
+        master_key: bytes,
+        clock: _Clock,
     ):
-        _insert_old_heartbeat(session, days_ago=35)
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=35)
         status = heartbeat_service.get_status(session)
         assert status.is_overdue is True
         assert status.days_since == 35
 
     def test_status_includes_alert_level(
-        self, heartbeat_service: HeartbeatService, session: Session
+        self,
+        heartbeat_service: HeartbeatService,
+        session: Session,
+        master_key: bytes,
+        clock: _Clock,
     ):
-        _insert_old_heartbeat(session, days_ago=65)
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=65)
         status = heartbeat_service.get_status(session)
         assert status.current_alert_level == "contact_alert"
 
@@ -344,104 +430,109 @@ class TestCheckDeadlines:
         assert alerts == []
 
     @pytest.mark.asyncio
-    async def test_no_alerts_when_recent_checkin(
-        self, heartbeat_service: HeartbeatService, session: Session
+    @pytest.mark.parametrize(
+        ("days_ago", "expected"),
+        [
+            (5, {}),
+            (31, {"reminder": "owner"}),
+            (46, {"reminder": "owner", "reminder_urgent": "owner"}),
+            (
+                61,
+                {
+                    "reminder": "owner",
+                    "reminder_urgent": "owner",
+                    "contact_alert": "emergency_contact",
+                },
+            ),
+            (
+                76,
+                {
+                    "reminder": "owner",
+                    "reminder_urgent": "owner",
+                    "contact_alert": "emergency_contact",
+                    "keyholder_alert": "all_keyholders",
+                },
+            ),
+            (
+                91,
+                {
+                    "reminder": "owner",
+                    "reminder_urgent": "owner",
+                    "contact_alert": "emergency_contact",
+                    "keyholder_alert": "all_keyholders",
+                    "inheritance_trigger": "all_keyholders",
+                },
+            ),
+        ],
+        ids=["recent", "30_day", "45_day", "60_day", "75_day", "90_day"],
+    )
+    async def test_gap_triggers_alerts(
+        self,
+        heartbeat_service: HeartbeatService,
+        session: Session,
+        master_key: bytes,
+        clock: _Clock,
+        days_ago: int,
+        expected: dict[str, str],
     ):
-        _insert_old_heartbeat(session, days_ago=5)
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=days_ago)
         alerts = await heartbeat_service.check_deadlines(session)
-        assert alerts == []
 
-    @pytest.mark.asyncio
-    async def test_30_day_gap_triggers_reminder(
-        self, heartbeat_service: HeartbeatService, session: Session
-    ):
-        _insert_old_heartbeat(session, days_ago=31)
-        alerts = await heartbeat_service.check_deadlines(session)
-        assert len(alerts) == 1
-        assert alerts[0].alert_type == "reminder"
-        assert alerts[0].recipient == "owner"
-        assert alerts[0].days_since_checkin == 31
+        assert {a.alert_type: a.recipient for a in alerts} == expected
+        assert len(alerts) == len(expected)
+        assert all(a.days_since_checkin == days_ago for a in alerts)
         # Verify persisted in DB
         db_alerts = session.exec(select(HeartbeatAlert)).all()
-        assert len(db_alerts) == 1
-
-    @pytest.mark.asyncio
-    async def test_45_day_gap_triggers_urgent_reminder(
-        self, heartbeat_service: HeartbeatService, session: Session
-    ):
-        _insert_old_heartbeat(session, days_ago=46)
-        alerts = await heartbeat_service.check_deadlines(session)
-        alert_types = {a.alert_type for a in alerts}
-        assert "reminder" in alert_types
-        assert "reminder_urgent" in alert_types
-        assert len(alerts) == 2
-
-    @pytest.mark.asyncio
-    async def test_60_day_gap_triggers_contact_alert(
-        self, heartbeat_service: HeartbeatService, session: Session
-    ):
-        _insert_old_heartbeat(session, days_ago=61)
-        alerts = await heartbeat_service.check_deadlines(session)
-        alert_types = {a.alert_type for a in alerts}
-        assert alert_types == {"reminder", "reminder_urgent", "contact_alert"}
-
-    @pytest.mark.asyncio
-    async def test_75_day_gap_triggers_keyholder_alert(
-        self, heartbeat_service: HeartbeatService, session: Session
-    ):
-        _insert_old_heartbeat(session, days_ago=76)
-        alerts = await heartbeat_service.check_deadlines(session)
-        alert_types = {a.alert_type for a in alerts}
-        assert alert_types == {
-            "reminder",
-            "reminder_urgent",
-            "contact_alert",
-            "keyholder_alert",
-        }
-
-    @pytest.mark.asyncio
-    async def test_90_day_gap_triggers_inheritance(
-        self, heartbeat_service: HeartbeatService, session: Session
-    ):
-        _insert_old_heartbeat(session, days_ago=91)
-        alerts = await heartbeat_service.check_deadlines(session)
-        alert_types = {a.alert_type for a in alerts}
-        assert alert_types == {
-            "reminder",
-            "reminder_urgent",
-            "contact_alert",
-            "keyholder_alert",
-            "inheritance_trigger",
-        }
-        assert len(alerts) == 5
+        assert len(db_alerts) == len(expected)
 
     @pytest.mark.asyncio
     async def test_alerts_not_duplicated(
-        self, heartbeat_service: HeartbeatService, session: Session
+        self,
+        heartbeat_service: HeartbeatService,
+        session: Session,
+        master_key: bytes,
+        clock: _Clock,
     ):
-        _insert_old_heartbeat(session, days_ago=35)
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=35)
         first = await heartbeat_service.check_deadlines(session)
         assert len(first) == 1
         second = await heartbeat_service.check_deadlines(session)
         assert len(second) == 0
 
     @pytest.mark.asyncio
+    async def test_escalation_only_sends_new_alert_types(
+        self,
+        heartbeat_service: HeartbeatService,
+        session: Session,
+        master_key: bytes,
+        clock: _Clock,
+    ):
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=35)
+        first = await heartbeat_service.check_deadlines(session)
+        assert [a.alert_type for a in first] == ["reminder"]
+
+        clock.advance(days=15)
+        second = await heartbeat_service.check_deadlines(session)
+        assert [a.alert_type for a in second] == ["reminder_urgent"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("stub_hmac")
     async def test_checkin_resets_alert_cycle(
         self,
         heartbeat_service: HeartbeatService,
         session: Session,
         master_key: bytes,
+        clock: _Clock,
     ):
         # Old heartbeat triggers reminder
-        _insert_old_heartbeat(session, days_ago=35)
+        _checkin_days_ago(heartbeat_service, session, master_key, clock, days_ago=35)
         alerts1 = await heartbeat_service.check_deadlines(session)
         assert len(alerts1) == 1
 
         # Fresh check-in resets cycle
         _do_checkin(heartbeat_service, session, master_key)
 
-        # New old heartbeat (simulated by inserting another backdated one)
-        # But the LATEST heartbeat is the fresh one, so no alerts yet
+        # The LATEST heartbeat is the fresh one, so no alerts yet
         alerts2 = await heartbeat_service.check_deadlines(session)
         assert len(alerts2) == 0
 
@@ -451,11 +542,9 @@ class TestCheckDeadlines:
 # ===========================================================================
 
 
+@pytest.mark.usefixtures("heartbeat_api")
 class TestHeartbeatAPI:
-    def test_get_status_returns_200(self, client, session, settings):
-        from app.main import app as fastapi_app
-
-        fastapi_app.state.heartbeat_service = HeartbeatService(settings)
+    def test_get_status_returns_200(self, client, session):
         resp = client.get("/api/heartbeat/status")
         assert resp.status_code == 200
         data = resp.json()
@@ -463,11 +552,7 @@ class TestHeartbeatAPI:
         assert "is_overdue" in data
         assert "alerts" in data
 
-    def test_full_checkin_flow_via_api(self, auth_client, session, settings):
-        from app.main import app as fastapi_app
-
-        fastapi_app.state.heartbeat_service = HeartbeatService(settings)
-
+    def test_full_checkin_flow_via_api(self, auth_client, session):
         # 1. Get challenge
         resp = auth_client.get("/api/heartbeat/challenge")
         assert resp.status_code == 200
@@ -514,10 +599,11 @@ class TestHeartbeatEdgeCases:
                 db=session,
             )
 
-    def test_checkin_with_wrong_key(self, heartbeat_service, session, master_key):
+    def test_checkin_with_wrong_key(
+        self, heartbeat_service, session, master_key, wrong_key
+    ):
         """Using the wrong master key to sign the challenge fails."""
         challenge_resp = heartbeat_service.generate_challenge(session)
-        wrong_key = os.urandom(32)
         wrong_hmac = hmac_sha256(wrong_key, challenge_resp.challenge.encode("utf-8"))
         with pytest.raises(ValueError, match="Invalid check-in response"):
             heartbeat_service.verify_checkin(
@@ -527,26 +613,11 @@ class TestHeartbeatEdgeCases:
                 db=session,
             )
 
+    @pytest.mark.usefixtures("stub_hmac")
     def test_multiple_checkins_reset_timer(self, heartbeat_service, session, master_key):
         """Multiple check-ins each produce separate Heartbeat records."""
-        _do_checkin(heartbeat_service, session, master_key)
-        _do_checkin(heartbeat_service, session, master_key)
+        _add_heartbeats(session, 2)
         _do_checkin(heartbeat_service, session, master_key)
 
         rows = session.exec(select(Heartbeat)).all()
         assert len(rows) == 3
-
-    @pytest.mark.asyncio
-    async def test_all_threshold_levels(self, heartbeat_service, session, master_key):
-        """Simulate 30, 45, 60, 75, 90 day gaps and check alert progression."""
-        from sqlmodel import delete as sql_delete
-        for days, expected_count in [(31, 1), (46, 2), (61, 3), (76, 4), (91, 5)]:
-            session.exec(sql_delete(HeartbeatAlert))
-            session.exec(sql_delete(Heartbeat))
-            session.commit()
-
-            _insert_old_heartbeat(session, days_ago=days)
-            alerts = await heartbeat_service.check_deadlines(session)
-            assert len(alerts) == expected_count, (
-                f"Expected {expected_count} alerts at {days} days, got {len(alerts)}"
-            )
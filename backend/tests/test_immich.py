@@ -1,63 +1,118 @@
 """Tests for Immich sync service and API endpoints."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 
 import httpx
 import pytest
+from sqlalchemy import event
 from sqlmodel import Session
 
 from app.models.memory import Memory
 from app.models.person import MemoryPerson, Person
 from app.services.immich import ImmichService, SyncFacesResult, SyncPeopleResult
+from tests.fakes import FakeRoutes, Handler
 
 
 # ── Fixtures ─────────────────────────────────────────────────────────
 
 
-@pytest.fixture(name="settings")
-def settings_fixture(tmp_path):
+@pytest.fixture(name="session")
+def session_fixture(savepoint_session):
+    """Share the module's engine; setup can flush instead of commit."""
+    return savepoint_session
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSettings:
+    """The subset of Settings that ImmichService reads."""
+
+    immich_url: str
+    immich_api_key: str
+    data_dir: Path
+
+
+@pytest.fixture(name="settings", scope="module")
+def settings_fixture(tmp_path_factory):
     """Settings with Immich configured."""
-    mock_settings = MagicMock()
-    mock_settings.immich_url = "http://immich:2283"
-    mock_settings.immich_api_key = "test-api-key"
-    mock_settings.data_dir = tmp_path
-    return mock_settings
+    return FakeSettings("http://immich:2283", "test-api-key", tmp_path_factory.mktemp("immich"))
 
 
-@pytest.fixture(name="settings_no_immich")
-def settings_no_immich_fixture(tmp_path):
+@pytest.fixture(name="settings_no_immich", scope="module")
+def settings_no_immich_fixture(tmp_path_factory):
     """Settings with Immich NOT configured."""
-    mock_settings = MagicMock()
-    mock_settings.immich_url = ""
-    mock_settings.immich_api_key = ""
-    mock_settings.data_dir = tmp_path
-    return mock_settings
+    return FakeSettings("", "", tmp_path_factory.mktemp("immich"))
+
+
+@pytest.fixture(name="immich_api")
+def immich_api_fixture(fake_routes: FakeRoutes):
+    """The fake Immich server for one test, reset to 404s afterwards."""
+    yield fake_routes
+    fake_routes.reset()
 
 
 @pytest.fixture(name="immich_service")
-def immich_service_fixture(settings):
-    return ImmichService(settings)
+def immich_service_fixture(settings, http_client):
+    return ImmichService(settings, client=http_client)
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.fixture(name="make_person")
+def make_person_fixture(session: Session) -> Callable[..., Person]:
+    """Insert a Person and flush, so its id is set without a commit."""
 
+    def _make(**fields) -> Person:
+        person = Person(**fields)
+        session.add(person)
+        session.flush()
+        return person
 
-def _mock_response(status_code: int = 200, json_data=None, content: bytes | None = None) -> httpx.Response:
-    """Build a mock httpx.Response."""
-    kwargs: dict = {
-        "status_code": status_code,
-        "request": httpx.Request("GET", "http://test"),
+    return _make
+
+
+@pytest.fixture(name="make_memory")
+def make_memory_fixture(session: Session) -> Callable[..., Memory]:
+    """Insert a Memory and flush, so its id is set without a commit."""
+
+    def _make(**fields) -> Memory:
+        memory = Memory(**fields)
+        session.add(memory)
+        session.flush()
+        return memory
+
+    return _make
+
+
+def _jpeg(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=b"\xff\xd8fake-jpeg")
+
+
+def _people_routes(people: dict) -> dict[str, Handler]:
+    """Serve *people* from /api/people, plus a fake JPEG thumbnail for each.
+
+    The listing is JSON-encoded once here rather than on every request.
+    """
+    body = json.dumps(people).encode()
+    routes: dict[str, Handler] = {
+        "/api/people": lambda request: httpx.Response(
+            200, content=body, headers=_JSON_HEADERS
+        ),
     }
-    if json_data is not None:
-        kwargs["json"] = json_data
-    elif content is not None:
-        kwargs["content"] = content
-    return httpx.Response(**kwargs)
+    for person in people["people"]:
+        routes[f"/api/people/{person['id']}/thumbnail"] = _jpeg
+    return routes
 
 
 # ── sync_people tests ────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_sync_people_creates_new_persons(immich_service, session: Session):
+async def test_sync_people_creates_new_persons(immich_service, immich_api, session: Session):
     people_response = {
         "people": [
             {"id": "aaa", "name": "Alice", "thumbnailPath": "/some/path"},
@@ -66,15 +121,8 @@ async def test_sync_people_creates_new_persons(immich_service, session: Session)
         ]
     }
 
-    async def mock_get(self, url, **kwargs):
-        if "/api/people" in str(url) and "/thumbnail" not in str(url):
-            return _mock_response(json_data=people_response)
-        if "/thumbnail" in str(url):
-            return _mock_response(content=b"\xff\xd8fake-jpeg")
-        return _mock_response(status_code=404)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_people(session)
+    immich_api.routes.update(_people_routes(people_response))
+    result = await immich_service.sync_people(session)
 
     assert result.created == 3
     assert result.updated == 0
@@ -93,25 +141,18 @@ async def test_sync_people_creates_new_persons(immich_service, session: Session)
 
 
 @pytest.mark.asyncio
-async def test_sync_people_updates_existing_person_name(immich_service, session: Session):
+async def test_sync_people_updates_existing_person_name(
+    immich_service, immich_api, make_person, session: Session
+):
     # Create existing person with old name
-    person = Person(name="Old Name", immich_person_id="abc")
-    session.add(person)
-    session.commit()
+    person = make_person(name="Old Name", immich_person_id="abc")
 
     people_response = {
         "people": [{"id": "abc", "name": "New Name", "thumbnailPath": "/path"}]
     }
 
-    async def mock_get(self, url, **kwargs):
-        if "/api/people" in str(url) and "/thumbnail" not in str(url):
-            return _mock_response(json_data=people_response)
-        if "/thumbnail" in str(url):
-            return _mock_response(content=b"\xff\xd8fake-jpeg")
-        return _mock_response(status_code=404)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_people(session)
+    immich_api.routes.update(_people_routes(people_response))
+    result = await immich_service.sync_people(session)
 
     assert result.updated == 1
     assert result.created == 0
@@ -121,28 +162,21 @@ async def test_sync_people_updates_existing_person_name(immich_service, session:
 
 
 @pytest.mark.asyncio
-async def test_sync_people_skips_unchanged(immich_service, session: Session):
-    person = Person(
+async def test_sync_people_skips_unchanged(
+    immich_service, immich_api, make_person, session: Session
+):
+    make_person(
         name="Alice",
         immich_person_id="aaa",
         face_thumbnail_path="immich_thumbnails/aaa.jpg",
     )
-    session.add(person)
-    session.commit()
 
     people_response = {
         "people": [{"id": "aaa", "name": "Alice", "thumbnailPath": "/path"}]
     }
 
-    async def mock_get(self, url, **kwargs):
-        if "/api/people" in str(url) and "/thumbnail" not in str(url):
-            return _mock_response(json_data=people_response)
-        if "/thumbnail" in str(url):
-            return _mock_response(content=b"\xff\xd8fake-jpeg")
-        return _mock_response(status_code=404)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_people(session)
+    immich_api.routes.update(_people_routes(people_response))
+    result = await immich_service.sync_people(session)
 
     assert result.unchanged == 1
     assert result.created == 0
@@ -150,12 +184,11 @@ async def test_sync_people_skips_unchanged(immich_service, session: Session):
 
 
 @pytest.mark.asyncio
-async def test_sync_people_handles_http_error(immich_service, session: Session):
-    async def mock_get(self, url, **kwargs):
-        return _mock_response(status_code=500, json_data={"message": "Internal Server Error"})
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_people(session)
+async def test_sync_people_handles_http_error(immich_service, immich_api, session: Session):
+    immich_api.routes["/api/people"] = lambda request: httpx.Response(
+        500, json={"message": "Internal Server Error"}
+    )
+    result = await immich_service.sync_people(session)
 
     assert result.created == 0
     assert result.updated == 0
@@ -164,59 +197,128 @@ async def test_sync_people_handles_http_error(immich_service, session: Session):
 
 
 @pytest.mark.asyncio
-async def test_sync_people_handles_per_person_failure(immich_service, session: Session):
+async def test_sync_people_handles_per_person_failure(immich_service, immich_api, session: Session):
     people_response = {
         "people": [
             {"id": "aaa", "name": "Alice", "thumbnailPath": "/path"},
             {"id": "bbb", "name": "Bob", "thumbnailPath": "/path"},
         ]
     }
-    call_count = 0
-
-    async def mock_get(self, url, **kwargs):
-        nonlocal call_count
-        if "/api/people" in str(url) and "/thumbnail" not in str(url):
-            return _mock_response(json_data=people_response)
-        if "/thumbnail" in str(url):
-            call_count += 1
-            if "aaa" in str(url):
-                raise httpx.ConnectError("connection refused")
-            return _mock_response(content=b"\xff\xd8fake-jpeg")
-        return _mock_response(status_code=404)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_people(session)
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    immich_api.routes.update(_people_routes(people_response))
+    immich_api.routes["/api/people/aaa/thumbnail"] = refuse
+    result = await immich_service.sync_people(session)
 
     # Both persons should be created — thumbnail failure is non-fatal
     assert result.created == 2
     assert result.errors == 0
 
 
+@pytest.mark.asyncio
+async def test_sync_people_looks_up_existing_persons_in_one_query(
+    immich_service, immich_api, session: Session, module_engine
+):
+    session.add_all(
+        Person(name=f"P{i}", immich_person_id=f"{i:04x}") for i in range(0, 20, 2)
+    )
+    session.flush()
+    people_response = {
+        "people": [{"id": f"{i:04x}", "name": f"P{i}"} for i in range(20)]
+    }
+    immich_api.routes.update(_people_routes(people_response))
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(module_engine, "before_cursor_execute", _record)
+    try:
+        result = await immich_service.sync_people(session)
+    finally:
+        event.remove(module_engine, "before_cursor_execute", _record)
+
+    assert result.created == 10
+    assert result.updated == 10  # thumbnail path newly set
+    person_selects = [
+        s for s in statements
+        if s.lstrip().startswith("SELECT") and "FROM persons" in s
+    ]
+    assert len(person_selects) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_people_counts_malformed_ids_as_errors(
+    immich_service, immich_api, session: Session
+):
+    people = [
+        {"id": "aaa", "name": "Alice"},
+        {"id": 42, "name": "Not a string"},
+        {"id": "../etc", "name": "Traversal"},
+    ]
+    body = json.dumps({"people": people}).encode()
+    immich_api.routes.update(_people_routes({"people": people[:1]}))
+    immich_api.routes["/api/people"] = lambda request: httpx.Response(
+        200, content=body, headers=_JSON_HEADERS
+    )
+
+    result = await immich_service.sync_people(session)
+
+    assert result.created == 1
+    assert result.errors == 2
+    thumbnail_paths = [
+        r.url.path for r in immich_api.requests if r.url.path.endswith("/thumbnail")
+    ]
+    assert thumbnail_paths == ["/api/people/aaa/thumbnail"]
+
+
+@pytest.mark.asyncio
+async def test_sync_people_shares_one_client_without_injection(
+    settings, immich_api, session: Session, monkeypatch
+):
+    immich_api.routes.update(_people_routes({
+        "people": [{"id": f"{i:04x}", "name": f"P{i}"} for i in range(5)]
+    }))
+    opened: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def _client(*args, **kwargs) -> httpx.AsyncClient:
+        client = real_client(transport=httpx.MockTransport(immich_api))
+        opened.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", _client)
+    result = await ImmichService(settings).sync_people(session)
+
+    assert result.created == 5
+    assert len(opened) == 1
+    assert opened[0].is_closed
+
+
 # ── sync_faces_for_asset tests ───────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_sync_faces_creates_memory_person_links(immich_service, session: Session):
+async def test_sync_faces_creates_memory_person_links(
+    immich_service, immich_api, make_memory, make_person, session: Session
+):
     # Create a memory and a person
-    memory = Memory(title="Photo", content="A photo")
-    session.add(memory)
-    person = Person(name="Alice", immich_person_id="aaa")
-    session.add(person)
-    session.commit()
-    session.refresh(memory)
-    session.refresh(person)
+    memory = make_memory(title="Photo", content="A photo")
+    person = make_person(name="Alice", immich_person_id="aaa")
 
     faces_response = [
         {"person": {"id": "aaa", "name": "Alice"}}
     ]
 
-    async def mock_get(self, url, **kwargs):
-        return _mock_response(json_data=faces_response)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_faces_for_asset(
-            asset_id="asset-123", memory_id=memory.id, session=session
-        )
+    immich_api.routes["/api/faces"] = lambda request: httpx.Response(
+        200, json=faces_response
+    )
+    result = await immich_service.sync_faces_for_asset(
+        asset_id="asset-123", memory_id=memory.id, session=session
+    )
 
     assert result.linked == 1
     assert result.already_linked == 0
@@ -234,56 +336,50 @@ async def test_sync_faces_creates_memory_person_links(immich_service, session: S
 
 
 @pytest.mark.asyncio
-async def test_sync_faces_handles_duplicate_link(immich_service, session: Session):
-    memory = Memory(title="Photo", content="A photo")
-    session.add(memory)
-    person = Person(name="Alice", immich_person_id="aaa")
-    session.add(person)
-    session.commit()
-    session.refresh(memory)
-    session.refresh(person)
+async def test_sync_faces_handles_duplicate_link(
+    immich_service, immich_api, make_memory, make_person, session: Session
+):
+    memory = make_memory(title="Photo", content="A photo")
+    person = make_person(name="Alice", immich_person_id="aaa")
 
     # Create existing link
     mp = MemoryPerson(
         memory_id=memory.id, person_id=person.id, source="immich"
     )
     session.add(mp)
-    session.commit()
+    session.flush()
 
     faces_response = [
         {"person": {"id": "aaa", "name": "Alice"}}
     ]
 
-    async def mock_get(self, url, **kwargs):
-        return _mock_response(json_data=faces_response)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_faces_for_asset(
-            asset_id="asset-123", memory_id=memory.id, session=session
-        )
+    immich_api.routes["/api/faces"] = lambda request: httpx.Response(
+        200, json=faces_response
+    )
+    result = await immich_service.sync_faces_for_asset(
+        asset_id="asset-123", memory_id=memory.id, session=session
+    )
 
     assert result.already_linked == 1
     assert result.linked == 0
 
 
 @pytest.mark.asyncio
-async def test_sync_faces_creates_unknown_person_if_not_local(immich_service, session: Session):
-    memory = Memory(title="Photo", content="A photo")
-    session.add(memory)
-    session.commit()
-    session.refresh(memory)
+async def test_sync_faces_creates_unknown_person_if_not_local(
+    immich_service, immich_api, make_memory, session: Session
+):
+    memory = make_memory(title="Photo", content="A photo")
 
     faces_response = [
         {"person": {"id": "ddd-eee-fff-000", "name": ""}}
     ]
 
-    async def mock_get(self, url, **kwargs):
-        return _mock_response(json_data=faces_response)
-
-    with patch("httpx.AsyncClient.get", new=mock_get):
-        result = await immich_service.sync_faces_for_asset(
-            asset_id="asset-123", memory_id=memory.id, session=session
-        )
+    immich_api.routes["/api/faces"] = lambda request: httpx.Response(
+        200, json=faces_response
+    )
+    result = await immich_service.sync_faces_for_asset(
+        asset_id="asset-123", memory_id=memory.id, session=session
+    )
 
     assert result.linked == 1
 
@@ -300,51 +396,48 @@ async def test_sync_faces_creates_unknown_person_if_not_local(immich_service, se
 
 
 @pytest.mark.asyncio
-async def test_push_person_name_success(immich_service, session: Session):
-    person = Person(name="Alice Updated", immich_person_id="aaa")
-    session.add(person)
-    session.commit()
-    session.refresh(person)
-
-    async def mock_put(self, url, **kwargs):
-        return _mock_response(status_code=200, json_data={"id": "aaa", "name": "Alice Updated"})
+async def test_push_person_name_success(immich_service, immich_api, make_person, session: Session):
+    person = make_person(name="Alice Updated", immich_person_id="aaa")
 
-    with patch("httpx.AsyncClient.put", new=mock_put):
-        result = await immich_service.push_person_name(
-            person_id=person.id, name="Alice Updated", session=session
-        )
+    immich_api.routes["/api/people/aaa"] = lambda request: httpx.Response(
+        200, json={"id": "aaa", "name": "Alice Updated"}
+    )
+    result = await immich_service.push_person_name(
+        person_id=person.id, name="Alice Updated", session=session
+    )
 
     assert result is True
+    [request] = immich_api.requests
+    assert request.method == "PUT"
+    assert json.loads(request.content) == {"name": "Alice Updated"}
 
 
 @pytest.mark.asyncio
-async def test_push_person_name_no_immich_id(immich_service, session: Session):
-    person = Person(name="Local Only")
-    session.add(person)
-    session.commit()
-    session.refresh(person)
+async def test_push_person_name_no_immich_id(
+    immich_service, immich_api, make_person, session: Session
+):
+    person = make_person(name="Local Only")
 
     # Should return False without calling Immich
     result = await immich_service.push_person_name(
         person_id=person.id, name="Local Only", session=session
     )
     assert result is False
+    assert immich_api.requests == []
 
 
 @pytest.mark.asyncio
-async def test_push_person_name_immich_error(immich_service, session: Session):
-    person = Person(name="Alice", immich_person_id="aaa")
-    session.add(person)
-    session.commit()
-    session.refresh(person)
-
-    async def mock_put(self, url, **kwargs):
-        return _mock_response(status_code=500, json_data={"message": "error"})
+async def test_push_person_name_immich_error(
+    immich_service, immich_api, make_person, session: Session
+):
+    person = make_person(name="Alice", immich_person_id="aaa")
 
-    with patch("httpx.AsyncClient.put", new=mock_put):
-        result = await immich_service.push_person_name(
-            person_id=person.id, name="Alice", session=session
-        )
+    immich_api.routes["/api/people/aaa"] = lambda request: httpx.Response(
+        500, json={"message": "error"}
+    )
+    result = await immich_service.push_person_name(
+        person_id=person.id, name="Alice", session=session
+    )
 
     assert result is False
 
@@ -370,13 +463,12 @@ def test_sync_immich_endpoint_returns_400_when_not_configured(client):
     assert "Immich not configured" in resp.json()["detail"]
 
 
-def test_push_name_endpoint_returns_400_for_non_immich_person(client, session: Session):
+def test_push_name_endpoint_returns_400_for_non_immich_person(
+    client, make_person, session: Session
+):
     """POST /api/persons/{id}/push-name-to-immich returns 400 for non-Immich person."""
     # Create a person without immich_person_id
-    person = Person(name="Local Only")
-    session.add(person)
-    session.commit()
-    session.refresh(person)
+    person = make_person(name="Local Only")
 
     # Even if Immich were configured, person has no immich_person_id
     # But first it will fail on "Immich not configured" since test env has no IMMICH_URL
@@ -2,58 +2,195 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import io
 import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
+from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 from PIL import Image
+from PIL.ExifTags import Base as ExifTags, GPS as GPSTags
+import pyrage
 from pyrage import x25519
 
+from app.models.memory import MemoryUpdate
 from app.services.encryption import EncryptedEnvelope, EncryptionService
 from app.services.ingestion import IngestionResult, IngestionService
 from app.services.preservation import PreservationResult, PreservationService
 from app.services.vault import VaultService
+from app.utils.crypto import sha256_hash
 
 
-def _fake_html_pres_result(html_bytes: bytes) -> PreservationResult:
-    """Create a fake PreservationResult for HTML → Markdown conversion."""
-    return PreservationResult(
-        preserved_data=b"# Fake Markdown\n\nConverted content.",
-        preserved_mime="text/markdown",
-        text_extract="# Fake Markdown\n\nConverted content.",
-        original_mime="text/html",
-        conversion_performed=True,
-        preservation_format="markdown",
+# Fake HTML → Markdown conversion; PreservationResult is frozen, so it is shared.
+FAKE_HTML_PRES = PreservationResult(
+    preserved_data=b"# Fake Markdown\n\nConverted content.",
+    preserved_mime="text/markdown",
+    text_extract="# Fake Markdown\n\nConverted content.",
+    original_mime="text/html",
+    conversion_performed=True,
+    preservation_format="markdown",
+)
+
+
+@pytest.fixture
+def detected_mime(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Make MIME sniffing report the MIME type the test is parametrized with.
+
+    Opt in with ``@pytest.mark.parametrize("detected_mime", [...], indirect=True)``.
+    """
+    monkeypatch.setattr(
+        "app.services.ingestion.detect_mime_type", lambda *args, **kwargs: request.param
     )
+    return request.param
+
+
+def _returning(value):
+    """Plain coroutine stub returning *value*; cheaper than an AsyncMock."""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+def _serve_html(
+    monkeypatch: pytest.MonkeyPatch, service: IngestionService, html: bytes
+) -> None:
+    """Make *service* fetch *html* for any URL and fake its Markdown conversion."""
+    monkeypatch.setattr(service, "_fetch_url", _returning(html))
+    monkeypatch.setattr(service._pres, "convert", _returning(FAKE_HTML_PRES))
+
+
+class MemoryVaultService(VaultService):
+    """VaultService that keeps ciphertext in a dict instead of on disk.
+
+    Encryption is still real; only the filesystem round trip is skipped.
+    """
+
+    def __init__(self, identity: x25519.Identity) -> None:
+        self.identity = identity
+        self.recipient = identity.to_public()
+        self._mem: dict[str, bytes] = {}
+
+    def store_file(
+        self,
+        file_data: bytes,
+        year: str,
+        month: str,
+        file_id: str | None = None,
+    ) -> tuple[str, str]:
+        if not self._YEAR_RE.match(year):
+            raise ValueError(f"Invalid year format: {year!r} (expected 4 digits)")
+        if not self._MONTH_RE.match(month):
+            raise ValueError(f"Invalid month format: {month!r} (expected 2 digits)")
+
+        vault_path = f"{year}/{month}/{file_id or uuid4()}.age"
+        self._mem[vault_path] = pyrage.encrypt(file_data, [self.recipient])
+        return (vault_path, sha256_hash(file_data))
+
+    def retrieve_file(self, vault_path: str) -> bytes:
+        try:
+            encrypted = self._mem[vault_path]
+        except KeyError:
+            raise FileNotFoundError(vault_path) from None
+        return pyrage.decrypt(encrypted, [self.identity])
+
+    def file_exists(self, vault_path: str) -> bool:
+        return vault_path in self._mem
+
+
+# master_key, encryption_service, vault_dir, identity, vault_service and
+# preservation_service are in conftest.py. Ingestion tests run against the
+# in-memory vault unless they inspect the .age files on disk.
+
 
+@pytest.fixture
+def vault_service_mem(identity: x25519.Identity) -> MemoryVaultService:
+    return MemoryVaultService(identity)
 
-# All fixtures (master_key, encryption_service, vault_dir, identity,
-# vault_service, preservation_service, ingestion_service) are now in conftest.py
+
+@pytest.fixture
+def ingestion_service(
+    vault_service_mem: MemoryVaultService,
+    encryption_service: EncryptionService,
+    preservation_service: PreservationService,
+) -> IngestionService:
+    return IngestionService(vault_service_mem, encryption_service, preservation_service)
+
+
+@pytest.fixture
+def disk_ingestion_service(
+    vault_service: VaultService,
+    encryption_service: EncryptionService,
+    preservation_service: PreservationService,
+) -> IngestionService:
+    return IngestionService(vault_service, encryption_service, preservation_service)
 
 
 # -- helpers -----------------------------------------------------------------
 
 
-def _make_jpeg_bytes() -> bytes:
-    img = Image.new("RGB", (16, 16), color=(255, 0, 0))
+# Encoded once per distinct argument set; the returned bytes are immutable,
+# so every test can share them.
+
+
+@functools.lru_cache
+def _make_jpeg_bytes(
+    width: int = 100, height: int = 75, color: tuple[int, int, int] = (255, 128, 0)
+) -> bytes:
+    img = Image.new("RGB", (width, height), color=color)
     buf = io.BytesIO()
     img.save(buf, format="JPEG")
     return buf.getvalue()
 
 
-def _make_png_bytes() -> bytes:
-    img = Image.new("RGB", (16, 16), color=(0, 255, 0))
+@functools.lru_cache
+def _make_png_bytes(
+    width: int = 100, height: int = 75, color: tuple[int, int, int] = (0, 255, 0)
+) -> bytes:
+    img = Image.new("RGB", (width, height), color=color)
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
 
 
+# Default 100x75 images, encoded once at import and shared by every test.
+JPEG_BYTES = _make_jpeg_bytes()
+PNG_BYTES = _make_png_bytes()
+
+# SHA-256 of the default JPEG; computed once because the encoder output
+# depends on the installed Pillow/libjpeg version.
+JPEG_SHA256 = hashlib.sha256(JPEG_BYTES).hexdigest()
+WORLD_SHA256 = "78ae647dc5544d227130a0682a51e30bc7777fbb6d8a8f17007463a3ecd1d524"
+
+
+@functools.lru_cache
+def _make_jpeg_with_gps(
+    lat: tuple[float, float, float],
+    lat_ref: str,
+    lon: tuple[float, float, float],
+    lon_ref: str,
+) -> bytes:
+    """16x16 JPEG whose EXIF GPS IFD holds the given DMS coordinates."""
+    img = Image.new("RGB", (16, 16), color=(255, 0, 0))
+    exif = img.getexif()
+    exif[ExifTags.GPSInfo] = {
+        GPSTags.GPSLatitude: lat,
+        GPSTags.GPSLatitudeRef: lat_ref,
+        GPSTags.GPSLongitude: lon,
+        GPSTags.GPSLongitudeRef: lon_ref,
+    }
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", exif=exif.tobytes())
+    return buf.getvalue()
+
+
 # -- ingest_text -------------------------------------------------------------
 
 
@@ -100,7 +237,7 @@ class TestIngestText:
     async def test_ingest_text_stores_in_vault(
         self,
         ingestion_service: IngestionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
     ) -> None:
         """Text is stored in the vault."""
         result = await ingestion_service.ingest_text(
@@ -108,7 +245,7 @@ class TestIngestText:
         )
 
         assert result.original_vault_path is not None
-        assert vault_service.file_exists(result.original_vault_path)
+        assert vault_service_mem.file_exists(result.original_vault_path)
 
     @pytest.mark.asyncio
     async def test_ingest_text_content_hash(
@@ -149,14 +286,14 @@ class TestIngestText:
 
 class TestIngestFileImage:
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_jpeg_detects_mime_and_preserves(
-        self, ingestion_service: IngestionService
+        self, ingestion_service: IngestionService, detected_mime: str
     ) -> None:
         """JPEG file → detects mime, preserves to PNG, stores both in vault."""
-        jpeg_data = _make_jpeg_bytes()
+        jpeg_data = JPEG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_data, "photo.jpg")
+        result = await ingestion_service.ingest_file(jpeg_data, "photo.jpg")
 
         assert result.mime_type == "image/jpeg"
         assert result.content_type == "photo"
@@ -166,14 +303,14 @@ class TestIngestFileImage:
         assert result.original_size == len(jpeg_data)
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/png"], indirect=True)
     async def test_ingest_png_no_preservation_copy(
-        self, ingestion_service: IngestionService
+        self, ingestion_service: IngestionService, detected_mime: str
     ) -> None:
         """PNG file is already archival — no separate archival copy stored."""
-        png_data = _make_png_bytes()
+        png_data = PNG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/png"):
-            result = await ingestion_service.ingest_file(png_data, "photo.png")
+        result = await ingestion_service.ingest_file(png_data, "photo.png")
 
         assert result.mime_type == "image/png"
         assert result.content_type == "photo"
@@ -183,142 +320,133 @@ class TestIngestFileImage:
 # -- ingest_file (text extract) ---------------------------------------------
 
 
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
 class TestIngestFileTextExtract:
     @pytest.mark.asyncio
-    async def test_docx_produces_text_extract(
-        self, ingestion_service: IngestionService, encryption_service: EncryptionService
+    @pytest.mark.parametrize(
+        ("detected_mime", "filename", "data", "text_extract"),
+        [
+            pytest.param(
+                DOCX_MIME, "doc.docx", b"fake docx",
+                "# Extracted Title\n\nSome text content",
+                id="docx",
+            ),
+            pytest.param(
+                "application/msword", "old.doc", b"fake doc",
+                "Extracted text from old Word document",
+                id="doc",
+            ),
+            pytest.param(
+                "application/rtf", "letter.rtf", b"fake rtf",
+                "Extracted text from RTF document",
+                id="rtf",
+            ),
+        ],
+        indirect=["detected_mime"],
+    )
+    async def test_document_produces_text_extract(
+        self,
+        ingestion_service: IngestionService,
+        encryption_service: EncryptionService,
+        detected_mime: str,
+        filename: str,
+        data: bytes,
+        text_extract: str,
     ) -> None:
-        """DOCX file → preserves to PDF, extracts markdown, all encrypted."""
-        # Mock the preservation to return a fake result with a text extract
+        """Document → preserves to PDF, extracts text, all encrypted."""
         fake_pres_result = PreservationResult(
             preserved_data=b"%PDF-1.4 fake",
             preserved_mime="application/pdf",
-            text_extract="# Extracted Title\n\nSome text content",
-            original_mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            text_extract=text_extract,
+            original_mime=detected_mime,
             conversion_performed=True,
             preservation_format="pdf-a+md",
         )
 
-        with patch("app.services.ingestion.detect_mime_type",
-                    return_value="application/vnd.openxmlformats-officedocument.wordprocessingml.document"):
-            with patch.object(
-                ingestion_service._pres, "convert", new_callable=AsyncMock, return_value=fake_pres_result
-            ):
-                result = await ingestion_service.ingest_file(b"fake docx", "doc.docx")
+        with patch.object(
+            ingestion_service._pres, "convert",
+            new_callable=AsyncMock, return_value=fake_pres_result
+        ):
+            result = await ingestion_service.ingest_file(data, filename)
 
-        assert result.mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        assert result.mime_type == detected_mime
         assert result.content_type == "document"
         assert result.text_extract_envelope is not None
 
         # Decrypt and verify
         text = encryption_service.decrypt(result.text_extract_envelope).decode("utf-8")
-        assert "Extracted Title" in text
+        assert text == text_extract
 
         # Search tokens generated from the text extract
         assert len(result.search_tokens) > 0
 
 
-# -- ingest_file (legacy document) ------------------------------------------
-
-
-class TestIngestFileLegacyDocument:
-    @pytest.mark.asyncio
-    async def test_doc_produces_text_extract(
-        self, ingestion_service: IngestionService, encryption_service: EncryptionService
-    ) -> None:
-        """DOC file → preserves to PDF, extracts text, all encrypted."""
-        fake_pres_result = PreservationResult(
-            preserved_data=b"%PDF-1.4 fake",
-            preserved_mime="application/pdf",
-            text_extract="Extracted text from old Word document",
-            original_mime="application/msword",
-            conversion_performed=True,
-            preservation_format="pdf-a+md",
-        )
-
-        with patch("app.services.ingestion.detect_mime_type",
-                    return_value="application/msword"):
-            with patch.object(
-                ingestion_service._pres, "convert",
-                new_callable=AsyncMock, return_value=fake_pres_result
-            ):
-                result = await ingestion_service.ingest_file(b"fake doc", "old.doc")
-
-        assert result.mime_type == "application/msword"
-        assert result.content_type == "document"
-        assert result.text_extract_envelope is not None
-        assert len(result.search_tokens) > 0
-
-    @pytest.mark.asyncio
-    async def test_rtf_produces_text_extract(
-        self, ingestion_service: IngestionService, encryption_service: EncryptionService
-    ) -> None:
-        """RTF file → preserves to PDF, extracts text, all encrypted."""
-        fake_pres_result = PreservationResult(
-            preserved_data=b"%PDF-1.4 fake",
-            preserved_mime="application/pdf",
-            text_extract="Extracted text from RTF document",
-            original_mime="application/rtf",
-            conversion_performed=True,
-            preservation_format="pdf-a+md",
-        )
-
-        with patch("app.services.ingestion.detect_mime_type",
-                    return_value="application/rtf"):
-            with patch.object(
-                ingestion_service._pres, "convert",
-                new_callable=AsyncMock, return_value=fake_pres_result
-            ):
-                result = await ingestion_service.ingest_file(b"fake rtf", "letter.rtf")
-
-        assert result.mime_type == "application/rtf"
-        assert result.content_type == "document"
-        assert result.text_extract_envelope is not None
-        assert len(result.search_tokens) > 0
-
-
 # -- detect_content_type / categorize_mime -----------------------------------
 
 
 class TestDetectContentType:
-    def test_categorize_image(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("image/jpeg") == "photo"
-        assert ingestion_service._categorize_mime("image/png") == "photo"
-
-    def test_categorize_audio(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("audio/mpeg") == "voice"
-        assert ingestion_service._categorize_mime("audio/flac") == "voice"
-
-    def test_categorize_video(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("video/mp4") == "video"
-
-    def test_categorize_html(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("text/html") == "webpage"
-
-    def test_categorize_document(self, ingestion_service: IngestionService) -> None:
-        docx = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        assert ingestion_service._categorize_mime(docx) == "document"
-        assert ingestion_service._categorize_mime("application/pdf") == "document"
-
-    def test_categorize_legacy_document(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("application/msword") == "document"
-        assert ingestion_service._categorize_mime("application/rtf") == "document"
-        assert ingestion_service._categorize_mime("text/rtf") == "document"
-
-    def test_categorize_text(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("text/plain") == "text"
-        assert ingestion_service._categorize_mime("text/markdown") == "text"
-        assert ingestion_service._categorize_mime("application/json") == "text"
-
-    def test_categorize_email(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("message/rfc822") == "email"
-
-    def test_categorize_unknown(self, ingestion_service: IngestionService) -> None:
-        assert ingestion_service._categorize_mime("application/x-unknown") == "document"
+    @pytest.mark.parametrize(
+        ("mime", "expected"),
+        [
+            ("image/jpeg", "photo"),
+            ("image/png", "photo"),
+            ("audio/mpeg", "voice"),
+            ("audio/flac", "voice"),
+            ("video/mp4", "video"),
+            ("text/html", "webpage"),
+            (DOCX_MIME, "document"),
+            ("application/pdf", "document"),
+            ("application/msword", "document"),
+            ("application/rtf", "document"),
+            ("text/rtf", "document"),
+            ("text/plain", "text"),
+            ("text/markdown", "text"),
+            ("application/json", "text"),
+            ("message/rfc822", "email"),
+            ("application/x-unknown", "document"),
+        ],
+    )
+    def test_categorize(self, mime: str, expected: str) -> None:
+        # Static method: no ingestion pipeline needed
+        assert IngestionService._categorize_mime(mime) == expected
 
 
 # -- ingest_url --------------------------------------------------------------
 
+ARTICLE_HTML = b"""
+<html><head><title>Test Article</title></head>
+<body>
+    <article>
+        <h1>Test Article</h1>
+        <p>This is the main content of the article with enough text to be extracted by readability.</p>
+        <p>Readability needs a reasonable amount of content to identify the article body.</p>
+        <p>Adding more paragraphs to ensure the content extraction works correctly.</p>
+        <p>This should be sufficient text for readability-lxml to detect as article content.</p>
+    </article>
+</body></html>
+"""
+
+PAGE_HTML = b"""
+<html><head><title>My Page Title</title></head>
+<body>
+    <article>
+        <h1>My Page Title</h1>
+        <p>Body content here with enough text for readability to extract.</p>
+        <p>More content to make readability happy about this being an article.</p>
+        <p>Even more paragraphs of sufficient length for extraction.</p>
+        <p>Final paragraph to round things out nicely.</p>
+    </article>
+</body></html>
+"""
+
+VAULT_TEST_HTML = b"<html><head><title>Vault Test</title></head><body><article><p>Content for vault test with enough text.</p><p>More text here.</p><p>And even more.</p><p>Sufficient content.</p></article></body></html>"
+
+DATE_TEST_HTML = b"<html><head><title>Date Test</title></head><body><article><p>Content.</p><p>More.</p><p>More.</p><p>More.</p></article></body></html>"
+
+NO_TITLE_HTML = b"<html><body><p>No title tag here at all but enough content for readability.</p><p>More text.</p><p>More text.</p><p>More text.</p></body></html>"
+
 
 class TestIngestUrl:
     """URL ingestion — fetch, extract, convert to Markdown, store."""
@@ -328,29 +456,12 @@ class TestIngestUrl:
         self,
         ingestion_service: IngestionService,
         encryption_service: EncryptionService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """URL ingestion fetches HTML, extracts content, returns IngestionResult."""
-        fake_html = b"""
-        <html><head><title>Test Article</title></head>
-        <body>
-            <article>
-                <h1>Test Article</h1>
-                <p>This is the main content of the article with enough text to be extracted by readability.</p>
-                <p>Readability needs a reasonable amount of content to identify the article body.</p>
-                <p>Adding more paragraphs to ensure the content extraction works correctly.</p>
-                <p>This should be sufficient text for readability-lxml to detect as article content.</p>
-            </article>
-        </body></html>
-        """
-
         # Mock httpx fetch and pandoc-based preservation
-        with patch.object(
-            ingestion_service, "_fetch_url", new_callable=AsyncMock, return_value=fake_html
-        ), patch.object(
-            ingestion_service._pres, "convert", new_callable=AsyncMock,
-            return_value=_fake_html_pres_result(fake_html),
-        ):
-            result = await ingestion_service.ingest_url("https://example.com/article")
+        _serve_html(monkeypatch, ingestion_service, ARTICLE_HTML)
+        result = await ingestion_service.ingest_url("https://example.com/article")
 
         assert isinstance(result, IngestionResult)
         assert result.mime_type == "text/html"
@@ -360,7 +471,7 @@ class TestIngestUrl:
         assert result.preserved_vault_path is not None
         assert result.title_envelope is not None
         assert result.content_envelope is not None
-        assert result.original_size == len(fake_html)
+        assert result.original_size == len(ARTICLE_HTML)
         assert len(result.search_tokens) > 0
 
     @pytest.mark.asyncio
@@ -368,28 +479,11 @@ class TestIngestUrl:
         self,
         ingestion_service: IngestionService,
         encryption_service: EncryptionService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Title and content are encrypted and can be decrypted."""
-        fake_html = b"""
-        <html><head><title>My Page Title</title></head>
-        <body>
-            <article>
-                <h1>My Page Title</h1>
-                <p>Body content here with enough text for readability to extract.</p>
-                <p>More content to make readability happy about this being an article.</p>
-                <p>Even more paragraphs of sufficient length for extraction.</p>
-                <p>Final paragraph to round things out nicely.</p>
-            </article>
-        </body></html>
-        """
-
-        with patch.object(
-            ingestion_service, "_fetch_url", new_callable=AsyncMock, return_value=fake_html
-        ), patch.object(
-            ingestion_service._pres, "convert", new_callable=AsyncMock,
-            return_value=_fake_html_pres_result(fake_html),
-        ):
-            result = await ingestion_service.ingest_url("https://example.com/page")
+        _serve_html(monkeypatch, ingestion_service, PAGE_HTML)
+        result = await ingestion_service.ingest_url("https://example.com/page")
 
         # Decrypt title — should be the page title from readability
         title = encryption_service.decrypt(result.title_envelope).decode("utf-8")
@@ -403,59 +497,47 @@ class TestIngestUrl:
     async def test_ingest_url_stores_original_html_in_vault(
         self,
         ingestion_service: IngestionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """The original full HTML is stored in the vault."""
-        fake_html = b"<html><head><title>Vault Test</title></head><body><article><p>Content for vault test with enough text.</p><p>More text here.</p><p>And even more.</p><p>Sufficient content.</p></article></body></html>"
-
-        with patch.object(
-            ingestion_service, "_fetch_url", new_callable=AsyncMock, return_value=fake_html
-        ), patch.object(
-            ingestion_service._pres, "convert", new_callable=AsyncMock,
-            return_value=_fake_html_pres_result(fake_html),
-        ):
-            result = await ingestion_service.ingest_url("https://example.com/vault-test")
+        _serve_html(monkeypatch, ingestion_service, VAULT_TEST_HTML)
+        result = await ingestion_service.ingest_url("https://example.com/vault-test")
 
         # Original HTML is in vault
-        assert vault_service.file_exists(result.original_vault_path)
-        decrypted = vault_service.retrieve_file(result.original_vault_path)
-        assert decrypted == fake_html
+        assert vault_service_mem.file_exists(result.original_vault_path)
+        decrypted = vault_service_mem.retrieve_file(result.original_vault_path)
+        assert decrypted == VAULT_TEST_HTML
 
     @pytest.mark.asyncio
     async def test_ingest_url_fetch_failure_propagates(
         self,
         ingestion_service: IngestionService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """HTTP errors from fetching are propagated."""
-        with patch.object(
-            ingestion_service,
-            "_fetch_url",
-            new_callable=AsyncMock,
-            side_effect=httpx.HTTPStatusError(
+        async def _fetch_not_found(url: str) -> bytes:
+            raise httpx.HTTPStatusError(
                 "Not Found",
-                request=httpx.Request("GET", "https://example.com/404"),
+                request=httpx.Request("GET", url),
                 response=httpx.Response(404),
-            ),
-        ):
-            with pytest.raises(httpx.HTTPStatusError):
-                await ingestion_service.ingest_url("https://example.com/404")
+            )
+
+        monkeypatch.setattr(ingestion_service, "_fetch_url", _fetch_not_found)
+        with pytest.raises(httpx.HTTPStatusError):
+            await ingestion_service.ingest_url("https://example.com/404")
 
     @pytest.mark.asyncio
     async def test_ingest_url_with_captured_at(
         self,
         ingestion_service: IngestionService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Custom captured_at is used for vault path."""
-        fake_html = b"<html><head><title>Date Test</title></head><body><article><p>Content.</p><p>More.</p><p>More.</p><p>More.</p></article></body></html>"
         dt = datetime(2025, 3, 20, tzinfo=timezone.utc)
 
-        with patch.object(
-            ingestion_service, "_fetch_url", new_callable=AsyncMock, return_value=fake_html
-        ), patch.object(
-            ingestion_service._pres, "convert", new_callable=AsyncMock,
-            return_value=_fake_html_pres_result(fake_html),
-        ):
-            result = await ingestion_service.ingest_url("https://example.com", captured_at=dt)
+        _serve_html(monkeypatch, ingestion_service, DATE_TEST_HTML)
+        result = await ingestion_service.ingest_url("https://example.com", captured_at=dt)
 
         assert result.original_vault_path.startswith("2025/03/")
 
@@ -464,17 +546,11 @@ class TestIngestUrl:
         self,
         ingestion_service: IngestionService,
         encryption_service: EncryptionService,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """If the page has no title, the URL is used as the title."""
-        fake_html = b"<html><body><p>No title tag here at all but enough content for readability.</p><p>More text.</p><p>More text.</p><p>More text.</p></body></html>"
-
-        with patch.object(
-            ingestion_service, "_fetch_url", new_callable=AsyncMock, return_value=fake_html
-        ), patch.object(
-            ingestion_service._pres, "convert", new_callable=AsyncMock,
-            return_value=_fake_html_pres_result(fake_html),
-        ):
-            result = await ingestion_service.ingest_url("https://example.com/no-title")
+        _serve_html(monkeypatch, ingestion_service, NO_TITLE_HTML)
+        result = await ingestion_service.ingest_url("https://example.com/no-title")
 
         title = encryption_service.decrypt(result.title_envelope).decode("utf-8")
         # Title should be either empty/short (readability might return empty) or fall back to URL
@@ -526,89 +602,73 @@ class TestIngestionResultDataclass:
 # Integration tests: end-to-end ingestion pipeline
 # ---------------------------------------------------------------------------
 
-VAULT_PATH_PATTERN = re.compile(r"^\d{4}/\d{2}/[0-9a-f\-]+\.age$")
-
-
-def _make_jpeg_bytes(
-    width: int = 100, height: int = 75, color: tuple[int, int, int] = (255, 128, 0)
-) -> bytes:
-    img = Image.new("RGB", (width, height), color=color)
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG")
-    return buf.getvalue()
-
-
-def _make_png_bytes(
-    width: int = 100, height: int = 75, color: tuple[int, int, int] = (0, 255, 0)
-) -> bytes:
-    img = Image.new("RGB", (width, height), color=color)
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    return buf.getvalue()
+VAULT_PATH_PATTERN = re.compile(r"\d{4}/\d{2}/[0-9a-f\-]+\.age", re.ASCII)
 
 
 class TestIngestionEndToEnd:
     """End-to-end integration: ingest file/text → vault + encryption roundtrip."""
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_jpeg_end_to_end(
         self,
         ingestion_service: IngestionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
+        detected_mime: str,
     ) -> None:
-        jpeg_bytes = _make_jpeg_bytes()
+        jpeg_bytes = JPEG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
+        result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
 
         assert result.mime_type == "image/jpeg"
         assert result.content_type == "photo"
         assert result.preservation_format == "png"
-        assert VAULT_PATH_PATTERN.match(result.original_vault_path)
+        assert VAULT_PATH_PATTERN.fullmatch(result.original_vault_path)
         assert result.preserved_vault_path is not None
-        assert VAULT_PATH_PATTERN.match(result.preserved_vault_path)
+        assert VAULT_PATH_PATTERN.fullmatch(result.preserved_vault_path)
         assert result.original_vault_path != result.preserved_vault_path
         assert result.original_size == len(jpeg_bytes)
 
         # Decrypt original from vault → equals original JPEG bytes
-        decrypted_original = vault_service.retrieve_file(result.original_vault_path)
+        decrypted_original = vault_service_mem.retrieve_file(result.original_vault_path)
         assert decrypted_original == jpeg_bytes
 
         # Decrypt preserved from vault → valid PNG with correct dimensions
-        decrypted_preserved = vault_service.retrieve_file(result.preserved_vault_path)
-        png_img = Image.open(io.BytesIO(decrypted_preserved))
-        assert png_img.format == "PNG"
-        assert png_img.size == (100, 75)
+        decrypted_preserved = vault_service_mem.retrieve_file(result.preserved_vault_path)
+        with Image.open(io.BytesIO(decrypted_preserved)) as png_img:
+            png_img.load()
+            fmt, size = png_img.format, png_img.size
+        assert fmt == "PNG"
+        assert size == (100, 75)
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_jpeg_content_hash_matches(
         self,
         ingestion_service: IngestionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
+        detected_mime: str,
     ) -> None:
-        jpeg_bytes = _make_jpeg_bytes()
+        jpeg_bytes = JPEG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
+        result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
 
-        # Decrypt original and verify hash
-        decrypted = vault_service.retrieve_file(result.original_vault_path)
-        expected_hash = hashlib.sha256(decrypted).hexdigest()
-        assert result.content_hash == expected_hash
+        assert result.content_hash == JPEG_SHA256
 
-        # Also verify via vault_service.verify_integrity
-        assert vault_service.verify_integrity(result.original_vault_path, result.content_hash) is True
+        # Also verify via vault_service_mem.verify_integrity
+        assert vault_service_mem.verify_integrity(result.original_vault_path, result.content_hash) is True
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_jpeg_vault_path_uses_current_date(
         self,
         ingestion_service: IngestionService,
+        detected_mime: str,
     ) -> None:
-        jpeg_bytes = _make_jpeg_bytes()
+        jpeg_bytes = JPEG_BYTES
 
         # Ingest with no explicit captured_at → uses current UTC date
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
+        result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
 
         now = datetime.now(timezone.utc)
         expected_prefix = f"{now.year}/{now.month:02d}/"
@@ -616,27 +676,27 @@ class TestIngestionEndToEnd:
 
         # Ingest with explicit captured_at
         dt = datetime(2025, 6, 15, tzinfo=timezone.utc)
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result2 = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg", captured_at=dt)
+        result2 = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg", captured_at=dt)
 
         assert result2.original_vault_path.startswith("2025/06/")
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/png"], indirect=True)
     async def test_ingest_png_no_duplicate_in_vault(
         self,
         ingestion_service: IngestionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
+        detected_mime: str,
     ) -> None:
-        png_bytes = _make_png_bytes()
+        png_bytes = PNG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/png"):
-            result = await ingestion_service.ingest_file(png_bytes, "photo.png")
+        result = await ingestion_service.ingest_file(png_bytes, "photo.png")
 
         # PNG is already archival → no separate preserved copy
         assert result.preserved_vault_path is None
 
         # Original can still be decrypted from vault
-        decrypted = vault_service.retrieve_file(result.original_vault_path)
+        decrypted = vault_service_mem.retrieve_file(result.original_vault_path)
         assert decrypted == png_bytes
 
     @pytest.mark.asyncio
@@ -644,7 +704,7 @@ class TestIngestionEndToEnd:
         self,
         ingestion_service: IngestionService,
         encryption_service: EncryptionService,
-        vault_service: VaultService,
+        vault_service_mem: MemoryVaultService,
     ) -> None:
         result = await ingestion_service.ingest_text(title="Hello", content="World")
 
@@ -658,15 +718,15 @@ class TestIngestionEndToEnd:
 
         # Vault file exists and decrypts to content bytes
         assert result.original_vault_path is not None
-        assert vault_service.file_exists(result.original_vault_path)
-        decrypted = vault_service.retrieve_file(result.original_vault_path)
+        assert vault_service_mem.file_exists(result.original_vault_path)
+        decrypted = vault_service_mem.retrieve_file(result.original_vault_path)
         assert decrypted == b"World"
 
         # Search tokens are non-empty
         assert len(result.search_tokens) > 0
 
         # Content hash matches SHA-256 of b"World"
-        assert result.content_hash == hashlib.sha256(b"World").hexdigest()
+        assert result.content_hash == WORLD_SHA256
 
     @pytest.mark.asyncio
     async def test_ingest_text_has_no_coordinates(
@@ -681,15 +741,16 @@ class TestIngestionEndToEnd:
         assert result.longitude is None
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_file_encryption_is_real(
         self,
-        ingestion_service: IngestionService,
+        disk_ingestion_service: IngestionService,
         vault_dir: Path,
+        detected_mime: str,
     ) -> None:
-        jpeg_bytes = _make_jpeg_bytes()
+        jpeg_bytes = JPEG_BYTES
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
+        result = await disk_ingestion_service.ingest_file(jpeg_bytes, "photo.jpg")
 
         # Read raw .age file from disk
         raw_bytes = (vault_dir / result.original_vault_path).read_bytes()
@@ -718,20 +779,8 @@ class TestExifGpsExtraction:
         self, ingestion_service: IngestionService
     ) -> None:
         """Extract GPS coords from a JPEG with EXIF GPS data."""
-        from PIL.ExifTags import Base as ExifTags, GPS as GPSTags
-
-        img = Image.new("RGB", (16, 16), color=(255, 0, 0))
-        exif = img.getexif()
-        gps_ifd = {
-            GPSTags.GPSLatitude: (40, 44, 55.2),    # 40°44'55.2"
-            GPSTags.GPSLatitudeRef: "N",
-            GPSTags.GPSLongitude: (73, 59, 10.8),    # 73°59'10.8"
-            GPSTags.GPSLongitudeRef: "W",
-        }
-        exif[ExifTags.GPSInfo] = gps_ifd
-        buf = io.BytesIO()
-        img.save(buf, format="JPEG", exif=exif.tobytes())
-        jpeg_data = buf.getvalue()
+        # 40°44'55.2"N 73°59'10.8"W
+        jpeg_data = _make_jpeg_with_gps((40, 44, 55.2), "N", (73, 59, 10.8), "W")
 
         lat, lon = ingestion_service._extract_gps_from_exif(jpeg_data)
         assert lat is not None
@@ -743,7 +792,7 @@ class TestExifGpsExtraction:
         self, ingestion_service: IngestionService
     ) -> None:
         """Returns (None, None) for images without EXIF data."""
-        png_data = _make_png_bytes()
+        png_data = PNG_BYTES
         lat, lon = ingestion_service._extract_gps_from_exif(png_data)
         assert lat is None
         assert lon is None
@@ -756,28 +805,30 @@ class TestExifGpsExtraction:
         assert lat is None
         assert lon is None
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"not an image", b"%PDF-1.7\n", b"GIF89a\x01\x00\x01\x00"],
+    )
+    def test_extract_gps_skips_pillow_for_non_exif_formats(
+        self, monkeypatch: pytest.MonkeyPatch, data: bytes
+    ) -> None:
+        """Bytes without an EXIF-capable header never reach Image.open."""
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Image.open should not be called")
+
+        monkeypatch.setattr("app.services.ingestion.Image.open", _fail)
+        assert IngestionService._extract_gps_from_exif(data) == (None, None)
+
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_photo_with_gps_sets_coordinates(
-        self, ingestion_service: IngestionService
+        self, ingestion_service: IngestionService, detected_mime: str
     ) -> None:
         """Ingesting a photo with GPS EXIF populates latitude/longitude."""
-        from PIL.ExifTags import Base as ExifTags, GPS as GPSTags
+        jpeg_data = _make_jpeg_with_gps((48, 51, 24.0), "N", (2, 21, 7.0), "E")  # Paris
 
-        img = Image.new("RGB", (16, 16), color=(255, 0, 0))
-        exif = img.getexif()
-        gps_ifd = {
-            GPSTags.GPSLatitude: (48, 51, 24.0),    # Paris
-            GPSTags.GPSLatitudeRef: "N",
-            GPSTags.GPSLongitude: (2, 21, 7.0),
-            GPSTags.GPSLongitudeRef: "E",
-        }
-        exif[ExifTags.GPSInfo] = gps_ifd
-        buf = io.BytesIO()
-        img.save(buf, format="JPEG", exif=exif.tobytes())
-        jpeg_data = buf.getvalue()
-
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_data, "paris.jpg")
+        result = await ingestion_service.ingest_file(jpeg_data, "paris.jpg")
 
         assert result.latitude is not None
         assert result.longitude is not None
@@ -785,13 +836,13 @@ class TestExifGpsExtraction:
         assert abs(result.longitude - 2.3519) < 0.01
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_photo_without_gps_has_none_coordinates(
-        self, ingestion_service: IngestionService
+        self, ingestion_service: IngestionService, detected_mime: str
     ) -> None:
         """Ingesting a photo without GPS EXIF has None latitude/longitude."""
-        jpeg_data = _make_jpeg_bytes()
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_data, "no_gps.jpg")
+        jpeg_data = JPEG_BYTES
+        result = await ingestion_service.ingest_file(jpeg_data, "no_gps.jpg")
 
         assert result.latitude is None
         assert result.longitude is None
@@ -804,7 +855,6 @@ class TestExifMetadataExtraction:
         self, ingestion_service: IngestionService
     ) -> None:
         """Extract camera make/model and shooting settings from EXIF."""
-        from PIL.ExifTags import Base as ExifTags
 
         img = Image.new("RGB", (640, 480), color=(0, 128, 255))
         exif = img.getexif()
@@ -848,7 +898,6 @@ class TestExifMetadataExtraction:
         self, ingestion_service: IngestionService
     ) -> None:
         """Extract GPS altitude from EXIF."""
-        from PIL.ExifTags import Base as ExifTags, GPS as GPSTags
 
         img = Image.new("RGB", (16, 16), color=(0, 0, 0))
         exif = img.getexif()
@@ -869,7 +918,6 @@ class TestExifMetadataExtraction:
         self, ingestion_service: IngestionService
     ) -> None:
         """GPSAltitudeRef as bytes (b'\\x01') means below sea level."""
-        from PIL.ExifTags import Base as ExifTags, GPS as GPSTags
 
         img = Image.new("RGB", (16, 16), color=(0, 0, 0))
         exif = img.getexif()
@@ -894,11 +942,11 @@ class TestExifMetadataExtraction:
         assert meta is None
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("detected_mime", ["image/jpeg"], indirect=True)
     async def test_ingest_photo_populates_exif_metadata(
-        self, ingestion_service: IngestionService
+        self, ingestion_service: IngestionService, detected_mime: str
     ) -> None:
         """Ingesting a photo with EXIF populates exif_metadata on result."""
-        from PIL.ExifTags import Base as ExifTags
 
         img = Image.new("RGB", (100, 80), color=(0, 0, 0))
         exif = img.getexif()
@@ -908,8 +956,7 @@ class TestExifMetadataExtraction:
         img.save(buf, format="JPEG", exif=exif.tobytes())
         jpeg_data = buf.getvalue()
 
-        with patch("app.services.ingestion.detect_mime_type", return_value="image/jpeg"):
-            result = await ingestion_service.ingest_file(jpeg_data, "nikon.jpg")
+        result = await ingestion_service.ingest_file(jpeg_data, "nikon.jpg")
 
         assert result.exif_metadata is not None
         assert result.exif_metadata["camera_make"] == "Nikon"
@@ -926,26 +973,22 @@ class TestExifMetadataExtraction:
 class TestLocationFieldValidation:
     def test_place_name_without_dek_raises(self):
         """MemoryUpdate rejects place_name without place_name_dek."""
-        from app.models.memory import MemoryUpdate
         with pytest.raises(ValueError, match="place_name and place_name_dek"):
             MemoryUpdate(place_name="Paris")
 
     def test_place_name_dek_without_name_raises(self):
         """MemoryUpdate rejects place_name_dek without place_name."""
-        from app.models.memory import MemoryUpdate
         with pytest.raises(ValueError, match="place_name and place_name_dek"):
             MemoryUpdate(place_name_dek="deadbeef")
 
     def test_both_place_name_fields_accepted(self):
         """MemoryUpdate accepts place_name + place_name_dek together."""
-        from app.models.memory import MemoryUpdate
         update = MemoryUpdate(place_name="abc", place_name_dek="def")
         assert update.place_name == "abc"
         assert update.place_name_dek == "def"
 
     def test_neither_place_name_field_accepted(self):
         """MemoryUpdate accepts neither place_name field."""
-        from app.models.memory import MemoryUpdate
         update = MemoryUpdate(title="test")
         assert update.place_name is None
         assert update.place_name_dek is None
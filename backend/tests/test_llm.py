@@ -6,59 +6,114 @@ and automatic failover to OpenAI-compatible fallback endpoints.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from app.services.llm import LLMError, LLMResponse, LLMService
+from tests.fakes import FakeRoutes, Handler
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────
 
 
-@pytest.fixture(name="llm_service")
-def llm_service_fixture() -> LLMService:
-    return LLMService(ollama_url="http://fake-ollama:11434", model="llama3.2:8b")
+def _refuse(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("Connection refused", request=request)
 
 
-@pytest.fixture(name="llm_with_fallback")
-def llm_with_fallback_fixture() -> LLMService:
+@pytest.fixture(name="llm_service", scope="module")
+def llm_service_fixture(http_client: httpx.AsyncClient) -> LLMService:
+    return LLMService(
+        ollama_url="http://fake-ollama:11434", model="llama3.2:8b", client=http_client,
+    )
+
+
+@pytest.fixture(name="llm_with_fallback", scope="module")
+def llm_with_fallback_fixture(http_client: httpx.AsyncClient) -> LLMService:
     return LLMService(
         ollama_url="http://fake-ollama:11434",
         model="llama3.2:8b",
         fallback_url="https://api.openai.com/v1",
         fallback_api_key="sk-test-key",
         fallback_model="gpt-4o-mini",
+        client=http_client,
     )
 
 
-# ── Helper: mock OpenAI chat/completions response ────────────────────
+@pytest.fixture(name="llm_api", autouse=True)
+def llm_api_fixture(
+    fake_routes: FakeRoutes, llm_service: LLMService, llm_with_fallback: LLMService
+):
+    """The fake endpoints for one test; both services start with a healthy Ollama."""
+    for service in (llm_service, llm_with_fallback):
+        service._ollama_healthy = True
+        service._last_ollama_fail_time_ns = 0
+    yield fake_routes
+    fake_routes.reset()
+
+
+# ── Helpers: canned Ollama / OpenAI responses ─────────────────────────
+
+
+def _json(body: dict, status_code: int = 200) -> Handler:
+    content = json.dumps(body).encode()
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code, content=content, headers={"content-type": "application/json"}
+        )
+
+    return _handler
+
+
+def _ollama_response(text: str = "The answer is 42.", model: str = "llama3.2:8b") -> Handler:
+    return _json({"response": text, "model": model, "total_duration": 5_000_000_000})
+
+
+def _openai_response(text: str = "Fallback answer.", model: str = "gpt-4o-mini") -> Handler:
+    return _json({"choices": [{"message": {"content": text}}], "model": model})
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: tuple[bytes, ...]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _chunked(*chunks: bytes) -> Handler:
+    """Serve *chunks* as separate reads, so lines can straddle chunk boundaries."""
 
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_ChunkStream(chunks))
 
-def _openai_response(text: str = "Fallback answer.", model: str = "gpt-4o-mini") -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "choices": [{"message": {"content": text}}],
-        "model": model,
-    }
-    mock_response.raise_for_status = MagicMock()
-    return mock_response
+    return _handler
 
 
-def _ollama_response(text: str = "The answer is 42.", model: str = "llama3.2:8b") -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "response": text,
-        "model": model,
-        "total_duration": 5_000_000_000,
-    }
-    mock_response.raise_for_status = MagicMock()
-    return mock_response
+OLLAMA_GENERATE = "/api/generate"
+OLLAMA_TAGS = "/api/tags"
+FALLBACK_CHAT = "/v1/chat/completions"
+FALLBACK_MODELS = "/v1/models"
+
+
+def _racing_service(http_client: httpx.AsyncClient) -> LLMService:
+    """A racing-enabled service whose Ollama is down but out of cooldown."""
+    service = LLMService(
+        ollama_url="http://fake-ollama:11434",
+        fallback_url="https://api.openai.com/v1",
+        fallback_api_key="sk-test-key",
+        fallback_model="gpt-4o-mini",
+        race_on_degraded=True,
+        client=http_client,
+    )
+    service._mark_ollama_down()
+    service._last_ollama_fail_time_ns = time.monotonic_ns() - 120 * 10**9
+    return service
 
 
 # ── TestGenerate ──────────────────────────────────────────────────────
@@ -67,19 +122,13 @@ def _ollama_response(text: str = "The answer is 42.", model: str = "llama3.2:8b"
 class TestGenerate:
     """Tests for LLMService.generate."""
 
-    @pytest.mark.asyncio
-    async def test_successful_generation(self, llm_service: LLMService) -> None:
+    async def test_successful_generation(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Mock Ollama returns a valid response; verify LLMResponse fields."""
-        mock_response = _ollama_response()
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response()
 
-            result = await llm_service.generate("What is the meaning of life?")
+        result = await llm_service.generate("What is the meaning of life?")
 
         assert isinstance(result, LLMResponse)
         assert result.text == "The answer is 42."
@@ -87,59 +136,38 @@ class TestGenerate:
         assert result.total_duration_ms == 5000
         assert result.backend == "ollama"
 
-    @pytest.mark.asyncio
-    async def test_with_system_prompt(self, llm_service: LLMService) -> None:
+    async def test_with_system_prompt(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Verify system prompt is passed in the request body."""
-        mock_response = _ollama_response("I am a helpful assistant.")
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response("I am a helpful assistant.")
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            await llm_service.generate(
-                "Hello", system="You are a memory assistant."
-            )
+        await llm_service.generate(
+            "Hello", system="You are a memory assistant."
+        )
 
-        call_kwargs = mock_client.post.call_args
-        request_body = call_kwargs[1]["json"]
+        (request,) = llm_api.requests
+        assert request.url == "http://fake-ollama:11434/api/generate"
+        request_body = json.loads(request.content)
         assert request_body["system"] == "You are a memory assistant."
 
-    @pytest.mark.asyncio
-    async def test_ollama_unreachable(self, llm_service: LLMService) -> None:
+    async def test_ollama_unreachable(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Connect error raises LLMError with 'Cannot connect'."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            with pytest.raises(LLMError, match="Cannot connect"):
-                await llm_service.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_ollama_error_response(self, llm_service: LLMService) -> None:
-        """HTTP 500 raises LLMError."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=mock_response,
-        )
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        with pytest.raises(LLMError, match="Cannot connect"):
+            await llm_service.generate("test prompt")
 
-            with pytest.raises(LLMError, match="Ollama returned HTTP"):
-                await llm_service.generate("test prompt")
+    async def test_ollama_error_response(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
+        """HTTP 500 raises LLMError."""
+        llm_api.routes[OLLAMA_GENERATE] = _json({"error": "boom"}, status_code=500)
+
+        with pytest.raises(LLMError, match="Ollama returned HTTP"):
+            await llm_service.generate("test prompt")
 
 
 # ── TestStream ────────────────────────────────────────────────────────
@@ -148,59 +176,31 @@ class TestGenerate:
 class TestStream:
     """Tests for LLMService.stream."""
 
-    @pytest.mark.asyncio
-    async def test_successful_stream(self, llm_service: LLMService) -> None:
+    async def test_successful_stream(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Mock Ollama streams NDJSON; collect tokens and verify joined output."""
-        lines = [
-            json.dumps({"response": "hello "}),
-            json.dumps({"response": "world", "done": True}),
-        ]
-
-        mock_response = AsyncMock()
-        mock_response.raise_for_status = MagicMock()
-
-        async def fake_aiter_lines():
-            for line in lines:
-                yield line
-
-        mock_response.aiter_lines = fake_aiter_lines
-
-        stream_cm = MagicMock()
-        stream_cm.__aenter__ = AsyncMock(return_value=mock_response)
-        stream_cm.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.stream = MagicMock(return_value=stream_cm)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        # The first NDJSON line is split across two network chunks
+        llm_api.routes[OLLAMA_GENERATE] = _chunked(
+            b'{"response": "hel',
+            b'lo "}\n{"response": "world", "done": true}\n',
+        )
 
-            tokens = []
-            async for token in llm_service.stream("Say hello world"):
-                tokens.append(token)
+        tokens = []
+        async for token in llm_service.stream("Say hello world"):
+            tokens.append(token)
 
         assert "".join(tokens) == "hello world"
 
-    @pytest.mark.asyncio
-    async def test_stream_ollama_unreachable(self, llm_service: LLMService) -> None:
+    async def test_stream_ollama_unreachable(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Connect error during stream raises LLMError."""
-        stream_cm = MagicMock()
-        stream_cm.__aenter__ = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
-        stream_cm.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.stream = MagicMock(return_value=stream_cm)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
 
-            with pytest.raises(LLMError, match="Cannot connect"):
-                async for _ in llm_service.stream("test prompt"):
-                    pass
+        with pytest.raises(LLMError, match="Cannot connect"):
+            async for _ in llm_service.stream("test prompt"):
+                pass
 
 
 # ── TestCheckHealth ───────────────────────────────────────────────────
@@ -209,32 +209,17 @@ class TestStream:
 class TestCheckHealth:
     """Tests for LLMService.check_health."""
 
-    @pytest.mark.asyncio
-    async def test_healthy(self, llm_service: LLMService) -> None:
+    async def test_healthy(self, llm_service: LLMService, llm_api: FakeRoutes) -> None:
         """200 response to /api/tags returns True."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        llm_api.routes[OLLAMA_TAGS] = _json({"models": []})
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        assert await llm_service.check_health() is True
 
-            assert await llm_service.check_health() is True
-
-    @pytest.mark.asyncio
-    async def test_unhealthy(self, llm_service: LLMService) -> None:
+    async def test_unhealthy(self, llm_service: LLMService, llm_api: FakeRoutes) -> None:
         """Connect error returns False."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        llm_api.routes[OLLAMA_TAGS] = _refuse
 
-            assert await llm_service.check_health() is False
+        assert await llm_service.check_health() is False
 
 
 # ── TestEnsureModel ───────────────────────────────────────────────────
@@ -243,41 +228,49 @@ class TestCheckHealth:
 class TestEnsureModel:
     """Tests for LLMService.ensure_model."""
 
-    @pytest.mark.asyncio
-    async def test_model_present(self, llm_service: LLMService) -> None:
+    async def test_model_present(self, llm_service: LLMService, llm_api: FakeRoutes) -> None:
         """/api/tags lists the model; returns True."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "models": [{"name": "llama3.2:8b"}, {"name": "nomic-embed-text"}]
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            assert await llm_service.ensure_model() is True
-
-    @pytest.mark.asyncio
-    async def test_model_absent(self, llm_service: LLMService) -> None:
+        llm_api.routes[OLLAMA_TAGS] = _json(
+            {"models": [{"name": "llama3.2:8b"}, {"name": "nomic-embed-text"}]}
+        )
+
+        assert await llm_service.ensure_model() is True
+
+    async def test_model_absent(self, llm_service: LLMService, llm_api: FakeRoutes) -> None:
         """/api/tags returns empty model list; returns False."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"models": []}
-        mock_response.raise_for_status = MagicMock()
+        llm_api.routes[OLLAMA_TAGS] = _json({"models": []})
+
+        assert await llm_service.ensure_model() is False
+
+
+# ── TestClientPool ────────────────────────────────────────────────────
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
 
-            assert await llm_service.ensure_model() is False
+class TestClientPool:
+    """Tests for the per-event-loop pooled AsyncClient."""
+
+    async def test_client_reused_until_closed(self) -> None:
+        """Requests on one loop share a client; close() drops it."""
+        service = LLMService(ollama_url="http://fake-ollama:11434")
+
+        client = service._get_client()
+        assert service._get_client() is client
+
+        await service.close()
+        assert client.is_closed
+        replacement = service._get_client()
+        assert replacement is not client
+        await service.close()
+
+    async def test_close_leaves_injected_client_open(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
+        """An injected client is used as-is and owned by the caller."""
+        service = LLMService(ollama_url="http://fake-ollama:11434", client=http_client)
+
+        assert service._get_client() is http_client
+        await service.close()
+        assert not http_client.is_closed
 
 
 # ── TestFallbackGenerate ──────────────────────────────────────────────
@@ -286,99 +279,160 @@ class TestEnsureModel:
 class TestFallbackGenerate:
     """Tests for automatic failover to OpenAI-compatible fallback."""
 
-    @pytest.mark.asyncio
-    async def test_fallback_on_ollama_connect_error(self, llm_with_fallback: LLMService) -> None:
+    async def test_fallback_on_ollama_connect_error(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """When Ollama fails, generate falls back to OpenAI endpoint."""
-        call_count = 0
-
-        async def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # First call: Ollama fails
-                raise httpx.ConnectError("Connection refused")
-            # Second call: OpenAI succeeds
-            return _openai_response()
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = side_effect
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await llm_with_fallback.generate("test prompt")
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
+        llm_api.routes[FALLBACK_CHAT] = _openai_response()
+
+        result = await llm_with_fallback.generate("test prompt")
 
         assert result.backend == "fallback"
         assert result.text == "Fallback answer."
         assert result.model == "gpt-4o-mini"
+        fallback_request = llm_api.requests[-1]
+        assert fallback_request.url == "https://api.openai.com/v1/chat/completions"
+        assert fallback_request.headers["Authorization"] == "Bearer sk-test-key"
 
-    @pytest.mark.asyncio
-    async def test_no_fallback_raises_when_not_configured(self, llm_service: LLMService) -> None:
+    async def test_no_fallback_raises_when_not_configured(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Without fallback, Ollama failure raises LLMError as before."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            with pytest.raises(LLMError, match="Cannot connect"):
-                await llm_service.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_both_fail_raises_error(self, llm_with_fallback: LLMService) -> None:
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
+
+        with pytest.raises(LLMError, match="Cannot connect"):
+            await llm_service.generate("test prompt")
+
+    async def test_both_fail_raises_error(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """When both Ollama AND fallback fail, LLMError is raised."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.side_effect = httpx.ConnectError("Connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            with pytest.raises(LLMError, match="Cannot connect to fallback"):
-                await llm_with_fallback.generate("test prompt")
-
-    @pytest.mark.asyncio
-    async def test_ollama_recovery_after_cooldown(self, llm_with_fallback: LLMService) -> None:
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
+        llm_api.routes[FALLBACK_CHAT] = _refuse
+
+        with pytest.raises(LLMError, match="Cannot connect to fallback"):
+            await llm_with_fallback.generate("test prompt")
+
+    async def test_ollama_recovery_after_cooldown(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """After cooldown, Ollama is re-tested and traffic returns."""
         # Mark Ollama down and simulate elapsed cooldown
         llm_with_fallback._mark_ollama_down()
-        llm_with_fallback._last_ollama_fail_time = time.monotonic() - 120  # well past 60s
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = _ollama_response()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        llm_with_fallback._last_ollama_fail_time_ns = time.monotonic_ns() - 120 * 10**9  # well past 60s
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response()
 
-            result = await llm_with_fallback.generate("test prompt")
+        result = await llm_with_fallback.generate("test prompt")
 
         assert result.backend == "ollama"
         assert llm_with_fallback._ollama_healthy is True
 
-    @pytest.mark.asyncio
-    async def test_health_suppression_skips_ollama(self, llm_with_fallback: LLMService) -> None:
+    async def test_health_suppression_skips_ollama(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """During cooldown, Ollama is skipped, fallback used directly."""
         # Mark Ollama down with recent timestamp (within cooldown)
         llm_with_fallback._ollama_healthy = False
-        llm_with_fallback._last_ollama_fail_time = time.monotonic()
+        llm_with_fallback._last_ollama_fail_time_ns = time.monotonic_ns()
 
         assert llm_with_fallback._should_try_ollama() is False
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = _openai_response()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        llm_api.routes[FALLBACK_CHAT] = _openai_response()
 
-            result = await llm_with_fallback.generate("test prompt")
+        result = await llm_with_fallback.generate("test prompt")
 
         assert result.backend == "fallback"
         # Verify only 1 call (to fallback), not 2 (Ollama was skipped)
-        assert mock_client.post.call_count == 1
+        assert [r.url.path for r in llm_api.requests] == [FALLBACK_CHAT]
+
+    async def test_race_on_degraded_prefers_fallback_over_hung_ollama(
+        self,
+        http_client: httpx.AsyncClient,
+        llm_api: FakeRoutes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With racing enabled, a recovering Ollama that hangs loses to the fallback."""
+        monkeypatch.setattr(LLMService, "_RACE_FALLBACK_DELAY", 0.0)
+        service = LLMService(
+            ollama_url="http://fake-ollama:11434",
+            fallback_url="https://api.openai.com/v1",
+            fallback_api_key="sk-test-key",
+            fallback_model="gpt-4o-mini",
+            race_on_degraded=True,
+            client=http_client,
+        )
+        service._mark_ollama_down()
+        service._last_ollama_fail_time_ns = time.monotonic_ns() - 120 * 10**9  # cooldown over
+
+        async def _hang(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(5)
+            raise httpx.ConnectError("Connection timed out", request=request)
+
+        llm_api.routes[OLLAMA_GENERATE] = _hang
+        llm_api.routes[FALLBACK_CHAT] = _openai_response()
+
+        result = await asyncio.wait_for(service.generate("test prompt"), timeout=2)
+
+        assert result.backend == "fallback"
+        assert service._ollama_healthy is False
+
+    async def test_race_ollama_answering_within_head_start_skips_fallback(
+        self,
+        http_client: httpx.AsyncClient,
+        llm_api: FakeRoutes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A recovering Ollama that answers inside its head start wins alone."""
+        monkeypatch.setattr(LLMService, "_RACE_FALLBACK_DELAY", 0.5)
+        service = _racing_service(http_client)
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response()
+        llm_api.routes[FALLBACK_CHAT] = _openai_response()
+
+        result = await service.generate("test prompt")
+        await asyncio.sleep(0.6)  # past the head start: a leaked fallback would fire
+
+        assert result.backend == "ollama"
+        assert service._ollama_healthy is True
+        assert [r.url.path for r in llm_api.requests] == [OLLAMA_GENERATE]
+
+    async def test_race_starts_fallback_as_soon_as_ollama_fails(
+        self,
+        http_client: httpx.AsyncClient,
+        llm_api: FakeRoutes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A refused Ollama connection cuts the fallback's wait short."""
+        monkeypatch.setattr(LLMService, "_RACE_FALLBACK_DELAY", 5.0)
+        service = _racing_service(http_client)
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
+        llm_api.routes[FALLBACK_CHAT] = _openai_response()
+
+        start = time.monotonic()
+        result = await asyncio.wait_for(service.generate("test prompt"), timeout=2)
+
+        assert result.backend == "fallback"
+        assert time.monotonic() - start < 1.0
+        assert service._ollama_healthy is False
+
+    async def test_race_never_used_for_local_only(
+        self, http_client: httpx.AsyncClient, llm_api: FakeRoutes
+    ) -> None:
+        """local_only prompts never reach the fallback, even when racing is on."""
+        service = LLMService(
+            ollama_url="http://fake-ollama:11434",
+            fallback_url="https://api.openai.com/v1",
+            race_on_degraded=True,
+            client=http_client,
+        )
+        service._mark_ollama_down()
+        service._last_ollama_fail_time_ns = time.monotonic_ns() - 120 * 10**9
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response()
+
+        result = await service.generate("secret", local_only=True)
+
+        assert result.backend == "ollama"
+        assert [r.url.path for r in llm_api.requests] == [OLLAMA_GENERATE]
 
 
 # ── TestFallbackStream ────────────────────────────────────────────────
@@ -387,54 +441,22 @@ class TestFallbackGenerate:
 class TestFallbackStream:
     """Tests for streaming with fallback."""
 
-    @pytest.mark.asyncio
-    async def test_stream_fallback_on_ollama_failure(self, llm_with_fallback: LLMService) -> None:
+    async def test_stream_fallback_on_ollama_failure(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Stream falls back to OpenAI SSE format."""
-        # First call (Ollama stream) fails
-        ollama_stream_cm = MagicMock()
-        ollama_stream_cm.__aenter__ = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused")
+        # Ollama stream fails; OpenAI stream succeeds with SSE format
+        llm_api.routes[OLLAMA_GENERATE] = _refuse
+        llm_api.routes[FALLBACK_CHAT] = _chunked(
+            b'data: {"choices":[{"delta":{"content":"hello "}}]}\r\n\r\n',
+            b': keep-alive comment\r\n\r\n',
+            b'data:{"choices":[{"delta":{"content":"world"}}]}\r\n\r\n',
+            b"data: [DONE]\r\n\r\n",
         )
-        ollama_stream_cm.__aexit__ = AsyncMock(return_value=False)
-
-        # Second call (OpenAI stream) succeeds with SSE format
-        sse_lines = [
-            'data: {"choices":[{"delta":{"content":"hello "}}]}',
-            'data: {"choices":[{"delta":{"content":"world"}}]}',
-            "data: [DONE]",
-        ]
-        openai_response = AsyncMock()
-        openai_response.raise_for_status = MagicMock()
-
-        async def fake_aiter_lines():
-            for line in sse_lines:
-                yield line
-
-        openai_response.aiter_lines = fake_aiter_lines
-
-        openai_stream_cm = MagicMock()
-        openai_stream_cm.__aenter__ = AsyncMock(return_value=openai_response)
-        openai_stream_cm.__aexit__ = AsyncMock(return_value=False)
-
-        call_count = 0
-
-        def stream_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return ollama_stream_cm
-            return openai_stream_cm
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.stream = MagicMock(side_effect=stream_side_effect)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            tokens = []
-            async for token in llm_with_fallback.stream("test prompt"):
-                tokens.append(token)
+
+        tokens = []
+        async for token in llm_with_fallback.stream("test prompt"):
+            tokens.append(token)
 
         assert "".join(tokens) == "hello world"
 
@@ -445,27 +467,18 @@ class TestFallbackStream:
 class TestFallbackHealth:
     """Tests for check_fallback_health."""
 
-    @pytest.mark.asyncio
-    async def test_fallback_healthy(self, llm_with_fallback: LLMService) -> None:
+    async def test_fallback_healthy(
+        self, llm_with_fallback: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Fallback /models returns 200."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        llm_api.routes[FALLBACK_MODELS] = _json({"data": []})
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        assert await llm_with_fallback.check_fallback_health() is True
 
-            assert await llm_with_fallback.check_fallback_health() is True
-
-    @pytest.mark.asyncio
     async def test_fallback_not_configured(self, llm_service: LLMService) -> None:
         """Returns False when no fallback URL."""
         assert await llm_service.check_fallback_health() is False
 
-    @pytest.mark.asyncio
     async def test_has_fallback_property(self, llm_service: LLMService, llm_with_fallback: LLMService) -> None:
         """has_fallback is False without config, True with config."""
         assert llm_service.has_fallback is False
@@ -478,16 +491,12 @@ class TestFallbackHealth:
 class TestLLMResponseBackend:
     """Test that LLMResponse.backend field is populated correctly."""
 
-    @pytest.mark.asyncio
-    async def test_ollama_backend_field(self, llm_service: LLMService) -> None:
+    async def test_ollama_backend_field(
+        self, llm_service: LLMService, llm_api: FakeRoutes
+    ) -> None:
         """Successful Ollama call sets backend='ollama'."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = _ollama_response()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await llm_service.generate("test")
+        llm_api.routes[OLLAMA_GENERATE] = _ollama_response()
+
+        result = await llm_service.generate("test")
 
         assert result.backend == "ollama"
@@ -1,7 +1,59 @@
 from __future__ import annotations
 
+import asyncio
 import calendar
 from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import select
+
+from app.db import get_session
+from app.dependencies import get_vault_service, require_auth
+from app.main import app as fastapi_app
+from app.models.memory import Memory
+from app.models.source import Source
+from app.services.vault import VaultService
+
+# 1 MiB body for the max-length create test, built and encoded once at import.
+_BIG_CONTENT = "a" * (1024 * 1024)
+_BIG_PAYLOAD = orjson.dumps({"title": "Big", "content": _BIG_CONTENT})
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.fixture(name="session")
+def session_fixture(savepoint_session):
+    """Share the module's engine instead of recreating the schema per test."""
+    return savepoint_session
+
+
+@pytest.fixture(name="vault_service", scope="module")
+def vault_service_fixture(tmp_path_factory, identity) -> VaultService:
+    """One vault for the module; every stored file gets a unique path."""
+    return VaultService(tmp_path_factory.mktemp("vault"), identity)
+
+
+@pytest.fixture(name="app_client", scope="module")
+def app_client_fixture():
+    """One TestClient, and so one app lifespan, for the whole module."""
+    with TestClient(fastapi_app) as tc:
+        yield tc
+
+
+@pytest.fixture(name="client")
+def client_fixture(app_client, session):
+    """Point the shared TestClient at this test's SAVEPOINT session."""
+
+    def _get_session_override():
+        yield session
+
+    fastapi_app.dependency_overrides[get_session] = _get_session_override
+    fastapi_app.dependency_overrides[require_auth] = lambda: "test-session-id"
+    yield app_client
+    fastapi_app.dependency_overrides.clear()
 
 
 def _same_day_in_year(dt: datetime, year: int) -> datetime:
@@ -15,6 +67,31 @@ def _same_day_in_year(dt: datetime, year: int) -> datetime:
     return dt.replace(year=year, day=min(dt.day, max_day))
 
 
+def _create(client, **payload) -> tuple[str, dict]:
+    """POST a memory, assert it was created, and return ``(id, body)``."""
+    resp = client.post("/api/memories", json=payload)
+    assert resp.status_code == 201
+    body = resp.json()
+    return body["id"], body
+
+
+def _memory_row_exists(session, memory_id: str) -> bool:
+    """Probe the memories table without expiring the session's identity map."""
+    stmt = select(Memory.id).where(Memory.id == memory_id)
+    return session.exec(stmt).first() is not None
+
+
+def _asgi_client() -> httpx.AsyncClient:
+    """Async client driving the app in-process, for concurrent requests.
+
+    Relies on the ``client`` fixture for the dependency overrides and on its
+    already-started lifespan for ``app.state``.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fastapi_app), base_url="http://test"
+    )
+
+
 def test_create_memory(client):
     """POST /api/memories should create a new memory and return 201."""
     payload = {
@@ -53,11 +130,12 @@ def test_list_memories(client):
     assert len(data) >= 2
 
 
-def test_list_memories_pagination(client):
+def test_list_memories_pagination(client, session):
     """GET /api/memories with skip and limit should paginate."""
-    # Create 3 memories
-    for i in range(3):
-        client.post("/api/memories", json={"title": f"Page {i}", "content": f"Content {i}"})
+    session.add_all([
+        Memory(title=f"Page {i}", content=f"Content {i}") for i in range(3)
+    ])
+    session.commit()
 
     response = client.get("/api/memories?skip=0&limit=2")
     assert response.status_code == 200
@@ -65,16 +143,21 @@ def test_list_memories_pagination(client):
     assert len(data) <= 2
 
 
-def test_get_memory(client):
+@pytest.fixture(name="base_memory")
+def base_memory_fixture(client) -> tuple[str, dict]:
+    """A memory created through the API, as ``(id, body)``."""
+    return _create(client, title="Base", content="Body")
+
+
+def test_get_memory(client, base_memory):
     """GET /api/memories/{id} should return the specific memory."""
-    create_resp = client.post("/api/memories", json={"title": "Fetch Me", "content": "Body"})
-    memory_id = create_resp.json()["id"]
+    memory_id, _ = base_memory
 
     response = client.get(f"/api/memories/{memory_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == memory_id
-    assert data["title"] == "Fetch Me"
+    assert data["title"] == "Base"
 
 
 def test_get_memory_not_found(client):
@@ -83,37 +166,37 @@ def test_get_memory_not_found(client):
     assert response.status_code == 404
 
 
-def test_update_memory(client):
-    """PUT /api/memories/{id} should update the memory."""
-    create_resp = client.post("/api/memories", json={"title": "Original", "content": "Body"})
-    memory_id = create_resp.json()["id"]
-
-    response = client.put(
-        f"/api/memories/{memory_id}",
-        json={"title": "Updated Title", "content": "Updated Body"},
-    )
+@pytest.mark.parametrize(
+    ("patch", "expected"),
+    [
+        (
+            {"title": "Updated Title", "content": "Updated Body"},
+            {"title": "Updated Title", "content": "Updated Body"},
+        ),
+        ({"content": "Changed"}, {"title": "Base", "content": "Changed"}),
+        (
+            {"visibility": "private"},
+            {"title": "Base", "content": "Body", "visibility": "private"},
+        ),
+    ],
+    ids=["full", "partial", "visibility"],
+)
+def test_update_memory(client, base_memory, patch, expected):
+    """PUT /api/memories/{id} updates only the given fields, and GET agrees."""
+    memory_id, _ = base_memory
+
+    response = client.put(f"/api/memories/{memory_id}", json=patch)
     assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == "Updated Title"
-    assert data["content"] == "Updated Body"
-
-
-def test_update_memory_partial(client):
-    """PUT /api/memories/{id} with partial fields should only update those fields."""
-    create_resp = client.post("/api/memories", json={"title": "Keep Me", "content": "Original"})
-    memory_id = create_resp.json()["id"]
-
-    response = client.put(f"/api/memories/{memory_id}", json={"content": "Changed"})
-    assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == "Keep Me"
-    assert data["content"] == "Changed"
+    updated = response.json()
+    fetched = client.get(f"/api/memories/{memory_id}").json()
+    for field, value in expected.items():
+        assert updated[field] == value
+        assert fetched[field] == value
 
 
 def test_delete_memory(client):
     """DELETE /api/memories/{id} should soft-delete and return 200."""
-    create_resp = client.post("/api/memories", json={"title": "Delete Me", "content": "Body"})
-    memory_id = create_resp.json()["id"]
+    memory_id, _ = _create(client, title="Delete Me", content="Body")
 
     response = client.delete(f"/api/memories/{memory_id}")
     assert response.status_code == 200
@@ -148,63 +231,42 @@ def test_create_memory_with_visibility(client):
     assert resp.json()["visibility"] == "private"
 
 
-def test_list_memories_visibility_filter(client):
+def test_list_memories_visibility_filter(client, session):
     """GET /api/memories?visibility= filters correctly."""
-    client.post("/api/memories", json={"title": "Pub", "content": "C", "visibility": "public"})
-    client.post("/api/memories", json={"title": "Priv", "content": "C", "visibility": "private"})
+    session.add_all([
+        Memory(title="Pub", content="C", visibility="public"),
+        Memory(title="Priv", content="C", visibility="private"),
+    ])
+    session.commit()
+
+    def _visibilities(query: str) -> set[str]:
+        return {m["visibility"] for m in client.get(f"/api/memories{query}").json()}
 
     # Default (public) should only return public
-    resp = client.get("/api/memories")
-    data = resp.json()
-    assert all(m["visibility"] == "public" for m in data)
+    assert _visibilities("") == {"public"}
 
     # Explicit private
-    resp = client.get("/api/memories?visibility=private")
-    data = resp.json()
-    assert all(m["visibility"] == "private" for m in data)
+    assert _visibilities("?visibility=private") == {"private"}
 
     # All
-    resp = client.get("/api/memories?visibility=all")
-    data = resp.json()
-    visibilities = {m["visibility"] for m in data}
-    assert "public" in visibilities
-    assert "private" in visibilities
-
-
-def test_update_memory_visibility(client):
-    """PUT /api/memories/{id} can change visibility."""
-    resp = client.post("/api/memories", json={"title": "T", "content": "C"})
-    memory_id = resp.json()["id"]
-    assert resp.json()["visibility"] == "public"
-
-    resp = client.put(f"/api/memories/{memory_id}", json={"visibility": "private"})
-    assert resp.status_code == 200
-    assert resp.json()["visibility"] == "private"
-
-    # Verify via GET
-    resp = client.get(f"/api/memories/{memory_id}")
-    assert resp.json()["visibility"] == "private"
-
-
-def test_create_memory_invalid_visibility(client):
-    """POST /api/memories with invalid visibility should return 422."""
-    resp = client.post("/api/memories", json={
-        "title": "Bad", "content": "C", "visibility": "banana"
-    })
-    assert resp.status_code == 422
-
-
-def test_update_memory_invalid_visibility(client):
-    """PUT /api/memories/{id} with invalid visibility should return 422."""
-    resp = client.post("/api/memories", json={"title": "T", "content": "C"})
-    memory_id = resp.json()["id"]
-    resp = client.put(f"/api/memories/{memory_id}", json={"visibility": "banana"})
-    assert resp.status_code == 422
-
-
-def test_list_memories_invalid_visibility_query(client):
-    """GET /api/memories?visibility=banana should return 422."""
-    resp = client.get("/api/memories?visibility=banana")
+    assert _visibilities("?visibility=all") == {"public", "private"}
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body"),
+    [
+        ("post", "/api/memories", {"title": "Bad", "content": "C", "visibility": "banana"}),
+        ("put", "/api/memories/{memory_id}", {"visibility": "banana"}),
+        ("get", "/api/memories?visibility=banana", None),
+    ],
+    ids=["create", "update", "list_query"],
+)
+def test_invalid_visibility_returns_422(client, method, path, body):
+    """Create, update and list all reject an unknown visibility with 422."""
+    if "{memory_id}" in path:
+        memory_id, _ = _create(client, title="T", content="C")
+        path = path.format(memory_id=memory_id)
+    resp = client.request(method, path, json=body)
     assert resp.status_code == 422
 
 
@@ -220,9 +282,9 @@ class TestMemoryEdgeCases:
 
     def test_create_memory_max_length_content(self, client):
         """POST with large content (1MB hex string) succeeds."""
-        big_content = "a" * (1024 * 1024)
-        resp = client.post("/api/memories", json={"title": "Big", "content": big_content})
+        resp = client.post("/api/memories", content=_BIG_PAYLOAD, headers=_JSON_HEADERS)
         assert resp.status_code == 201
+        assert len(orjson.loads(resp.content)["content"]) == len(_BIG_CONTENT)
 
     def test_create_memory_with_metadata_json(self, client):
         """POST with metadata_json field stores it."""
@@ -257,20 +319,21 @@ class TestMemoryEdgeCases:
 
     def test_delete_already_deleted_404(self, client):
         """DELETE a memory twice returns 404 on second attempt."""
-        create_resp = client.post("/api/memories", json={"title": "Del2x", "content": "Body"})
-        memory_id = create_resp.json()["id"]
+        memory_id, _ = _create(client, title="Del2x", content="Body")
 
         client.delete(f"/api/memories/{memory_id}")
         resp = client.delete(f"/api/memories/{memory_id}")
         assert resp.status_code == 404
 
-    def test_concurrent_creates(self, client):
+    async def test_concurrent_creates(self, client):
         """Multiple POSTs produce unique IDs."""
-        ids = set()
-        for i in range(5):
-            resp = client.post("/api/memories", json={"title": f"C{i}", "content": f"C{i}"})
-            assert resp.status_code == 201
-            ids.add(resp.json()["id"])
+        async with _asgi_client() as ac:
+            responses = await asyncio.gather(*(
+                ac.post("/api/memories", json={"title": f"C{i}", "content": f"C{i}"})
+                for i in range(5)
+            ))
+        assert all(resp.status_code == 201 for resp in responses)
+        ids = {resp.json()["id"] for resp in responses}
         assert len(ids) == 5
 
 
@@ -280,16 +343,21 @@ class TestMemoryEdgeCases:
 class TestDeleteMemoryCascade:
     """Tests for cascade deletion of vault files on memory delete."""
 
+    @pytest.fixture(name="cascade_client")
+    def cascade_client_fixture(self, client, vault_service, mock_embedding_service):
+        """Shared TestClient wired to a real vault and a mock embedding service.
+
+        The ``client`` fixture clears the dependency overrides on teardown.
+        """
+        fastapi_app.dependency_overrides[get_vault_service] = lambda: vault_service
+        fastapi_app.state.embedding_service = mock_embedding_service
+        yield client
+        fastapi_app.state.embedding_service = None
+
     def test_delete_memory_removes_vault_files(
-        self, session, vault_service, mock_embedding_service
+        self, cascade_client, session, vault_service
     ):
         """DELETE /api/memories/{id} should delete vault .age files."""
-        from app.main import app as fastapi_app
-        from app.db import get_session
-        from app.dependencies import get_vault_service, require_auth
-        from app.models.memory import Memory
-        from app.models.source import Source
-        from fastapi.testclient import TestClient
 
         # Create a memory with a source that has vault files
         memory = Memory(title="Test", content="Body")
@@ -313,49 +381,23 @@ class TestDeleteMemoryCascade:
             content_hash="abc123",
         )
         session.add(source)
-        session.commit()
+        session.flush()
 
         # Verify files exist
         assert vault_service.file_exists(vault_path) is True
         assert vault_service.file_exists(preserved_path) is True
 
-        def _get_session_override():
-            yield session
-
-        def _vault_override():
-            return vault_service
+        resp = cascade_client.delete(f"/api/memories/{memory.id}")
+        assert resp.status_code == 204
 
-        fastapi_app.dependency_overrides[get_session] = _get_session_override
-        fastapi_app.dependency_overrides[get_vault_service] = _vault_override
-        fastapi_app.dependency_overrides[require_auth] = lambda: "test-session"
-
-        # Set mock embedding service on app state
-        fastapi_app.state.embedding_service = mock_embedding_service
-
-        try:
-            with TestClient(fastapi_app) as tc:
-                resp = tc.delete(f"/api/memories/{memory.id}")
-                assert resp.status_code == 204
-
-            # Verify vault files are gone
-            assert vault_service.file_exists(vault_path) is False
-            assert vault_service.file_exists(preserved_path) is False
-        finally:
-            fastapi_app.dependency_overrides.clear()
-            fastapi_app.state.embedding_service = None
+        # Verify vault files are gone
+        assert vault_service.file_exists(vault_path) is False
+        assert vault_service.file_exists(preserved_path) is False
 
     def test_delete_memory_succeeds_when_vault_delete_fails(
-        self, session, mock_embedding_service
+        self, cascade_client, session
     ):
         """Memory deletion should succeed even if vault file deletion fails."""
-        from unittest.mock import MagicMock
-        from app.main import app as fastapi_app
-        from app.db import get_session
-        from app.dependencies import get_vault_service, require_auth
-        from app.models.memory import Memory
-        from app.models.source import Source
-        from app.services.vault import VaultService
-        from fastapi.testclient import TestClient
 
         memory = Memory(title="Test", content="Body")
         session.add(memory)
@@ -375,70 +417,36 @@ class TestDeleteMemoryCascade:
             content_hash="abc123",
         )
         session.add(source)
-        session.commit()
+        session.flush()
 
         # Mock vault service that raises on delete
         mock_vault = MagicMock(spec=VaultService)
         mock_vault.delete_file.side_effect = OSError("disk error")
-
-        def _get_session_override():
-            yield session
-
-        fastapi_app.dependency_overrides[get_session] = _get_session_override
         fastapi_app.dependency_overrides[get_vault_service] = lambda: mock_vault
-        fastapi_app.dependency_overrides[require_auth] = lambda: "test-session"
-        fastapi_app.state.embedding_service = mock_embedding_service
 
-        try:
-            with TestClient(fastapi_app) as tc:
-                resp = tc.delete(f"/api/memories/{memory.id}")
-                # Should still succeed despite vault error
-                assert resp.status_code == 204
+        resp = cascade_client.delete(f"/api/memories/{memory.id}")
+        # Should still succeed despite vault error
+        assert resp.status_code == 204
 
-            # Verify vault delete was attempted
-            mock_vault.delete_file.assert_called_once_with("2026/02/fake.age")
+        # Verify vault delete was attempted
+        mock_vault.delete_file.assert_called_once_with("2026/02/fake.age")
 
-            # Verify memory is actually gone from DB (use fresh query to bypass ORM cache)
-            session.expire_all()
-            assert session.get(Memory, memory_id) is None
-        finally:
-            fastapi_app.dependency_overrides.clear()
-            fastapi_app.state.embedding_service = None
+        # Verify memory is actually gone from DB (a direct query bypasses the ORM cache)
+        assert _memory_row_exists(session, memory_id) is False
 
-    def test_delete_memory_with_no_sources(
-        self, session, vault_service, mock_embedding_service
-    ):
+    def test_delete_memory_with_no_sources(self, cascade_client, session):
         """DELETE should work for memories that have no Source records."""
-        from app.main import app as fastapi_app
-        from app.db import get_session
-        from app.dependencies import get_vault_service, require_auth
-        from app.models.memory import Memory
-        from fastapi.testclient import TestClient
 
         memory = Memory(title="No Source", content="text only")
         session.add(memory)
-        session.commit()
+        session.flush()
         memory_id = memory.id
 
-        def _get_session_override():
-            yield session
+        resp = cascade_client.delete(f"/api/memories/{memory.id}")
+        assert resp.status_code == 204
 
-        fastapi_app.dependency_overrides[get_session] = _get_session_override
-        fastapi_app.dependency_overrides[get_vault_service] = lambda: vault_service
-        fastapi_app.dependency_overrides[require_auth] = lambda: "test-session"
-        fastapi_app.state.embedding_service = mock_embedding_service
-
-        try:
-            with TestClient(fastapi_app) as tc:
-                resp = tc.delete(f"/api/memories/{memory.id}")
-                assert resp.status_code == 204
-
-            # Verify memory is gone (expire ORM cache to force fresh DB read)
-            session.expire_all()
-            assert session.get(Memory, memory_id) is None
-        finally:
-            fastapi_app.dependency_overrides.clear()
-            fastapi_app.state.embedding_service = None
+        # Verify memory is gone (a direct query bypasses the ORM cache)
+        assert _memory_row_exists(session, memory_id) is False
 
 
 # ── On This Day ──────────────────────────────────────────────────────
@@ -449,7 +457,6 @@ class TestOnThisDay:
 
     def test_on_this_day_returns_matching_memories(self, client, session):
         """Memories from previous years on today's month+day are returned."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         one_year_ago = _same_day_in_year(now, now.year - 1)
@@ -468,7 +475,6 @@ class TestOnThisDay:
 
     def test_on_this_day_excludes_current_year(self, client, session):
         """Memories from the current year are NOT returned."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         mem = Memory(
@@ -485,7 +491,6 @@ class TestOnThisDay:
 
     def test_on_this_day_excludes_different_day(self, client, session):
         """Memories from a different day are NOT returned."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         last_year = _same_day_in_year(now, now.year - 1)
@@ -515,7 +520,6 @@ class TestOnThisDay:
 
     def test_on_this_day_ordered_by_year_descending(self, client, session):
         """Results are ordered by year descending (most recent first)."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         mem_2yr = Memory(
@@ -538,7 +542,6 @@ class TestOnThisDay:
 
     def test_on_this_day_limits_to_10(self, client, session):
         """At most 10 memories are returned."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         for i in range(1, 15):
@@ -559,7 +562,6 @@ class TestOnThisDay:
 
     def test_on_this_day_filters_by_visibility(self, client, session):
         """Private memories are excluded when default visibility='public' is used."""
-        from app.models.memory import Memory
 
         now = datetime.now(timezone.utc)
         one_year_ago = _same_day_in_year(now, now.year - 1)
@@ -614,7 +616,6 @@ class TestCompoundFilters:
 
     def test_list_memories_filter_by_date_from(self, client, session):
         """Only memories on or after date_from are returned."""
-        from app.models.memory import Memory
 
         old = Memory(
             title="Old", content="C",
@@ -636,7 +637,6 @@ class TestCompoundFilters:
 
     def test_list_memories_filter_by_date_to(self, client, session):
         """Only memories on or before date_to are returned."""
-        from app.models.memory import Memory
 
         old = Memory(
             title="Old", content="C",
@@ -658,7 +658,6 @@ class TestCompoundFilters:
 
     def test_list_memories_filter_by_date_range(self, client, session):
         """Only memories within the date range are returned."""
-        from app.models.memory import Memory
 
         before = Memory(
             title="Before", content="C",
@@ -685,7 +684,6 @@ class TestCompoundFilters:
 
     def test_list_memories_filter_by_content_type_comma_separated(self, client, session):
         """Comma-separated content_type returns matching types only."""
-        from app.models.memory import Memory
 
         text_mem = Memory(title="T", content="C", content_type="text")
         photo_mem = Memory(title="P", content="C", content_type="photo")
@@ -703,7 +701,6 @@ class TestCompoundFilters:
 
     def test_list_memories_compound_filters_stack(self, client, session):
         """Multiple filters applied simultaneously use AND logic."""
-        from app.models.memory import Memory
 
         # Matches all criteria
         match = Memory(
@@ -756,7 +753,6 @@ class TestCompoundFilters:
 
     def test_list_memories_date_filters_with_year_filter(self, client, session):
         """date_from stacks with year filter using AND logic."""
-        from app.models.memory import Memory
 
         jan = Memory(
             title="Jan", content="C",
@@ -778,7 +774,6 @@ class TestCompoundFilters:
 
     def test_list_memories_empty_content_type_ignored(self, client, session):
         """Empty content_type query param is treated as no filter."""
-        from app.models.memory import Memory
 
         text_mem = Memory(title="T", content="C", content_type="text")
         photo_mem = Memory(title="P", content="C", content_type="photo")
@@ -795,7 +790,6 @@ class TestCompoundFilters:
 
     def test_list_memories_date_to_explicit_midnight_datetime(self, client, session):
         """Explicit midnight datetime is treated as exact bound, not end-of-day."""
-        from app.models.memory import Memory
 
         at_midnight = Memory(
             title="Midnight", content="C",
@@ -820,7 +814,6 @@ class TestCompoundFilters:
 
     def test_list_memories_has_location_filter(self, client, session):
         """GET /api/memories?has_location=true returns only memories with lat/lng."""
-        from app.models.memory import Memory
 
         with_loc1 = Memory(
             title="Paris", content="C",
@@ -856,7 +849,6 @@ class TestCompoundFilters:
 
     def test_list_memories_content_type_single_still_works(self, client, session):
         """Single content_type (no comma) still works as before."""
-        from app.models.memory import Memory
 
         photo = Memory(title="Photo", content="C", content_type="photo")
         text = Memory(title="Text", content="C", content_type="text")
@@ -869,3 +861,36 @@ class TestCompoundFilters:
         ids = [m["id"] for m in data]
         assert photo.id in ids
         assert text.id not in ids
+
+
+# ── Benchmarks ───────────────────────────────────────────────────────
+
+
+@pytest.mark.benchmark(group="memories")
+class TestMemoryBenchmarks:
+    """Perf floors for the hot create/list paths (see ``make bench-local``).
+
+    Rounds are pinned low so the plain test run stays cheap; pytest-benchmark
+    also collapses them to a single call under xdist.
+    """
+
+    def test_create_memory_max_length_content_bench(self, client, benchmark):
+        """POST /api/memories with a 1 MiB body."""
+        def _post():
+            client.post(
+                "/api/memories", content=_BIG_PAYLOAD, headers=_JSON_HEADERS
+            ).raise_for_status()
+
+        benchmark.pedantic(_post, rounds=5, iterations=1)
+
+    def test_list_memories_bench(self, client, session, benchmark):
+        """GET /api/memories hydrating a 50-row page."""
+        session.add_all([
+            Memory(title=f"Bench {i}", content=f"Content {i}") for i in range(50)
+        ])
+        session.commit()
+
+        def _list():
+            client.get("/api/memories?limit=50").raise_for_status()
+
+        benchmark.pedantic(_list, rounds=20, iterations=1)
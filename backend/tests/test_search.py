@@ -13,6 +13,7 @@ from __future__ import annotations
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from sqlmodel import Session
 
@@ -177,12 +178,12 @@ def _make_scored_chunk(
 
 
 def _mock_ollama_embed(fake_embedding):
-    """Return a mock response for httpx.AsyncClient.post returning embeddings."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.raise_for_status = MagicMock()
-    mock_response.json.return_value = {"embeddings": [fake_embedding]}
-    return mock_response
+    """Return a real Ollama /api/embed response for a patched AsyncClient.post."""
+    return httpx.Response(
+        200,
+        json={"embeddings": [fake_embedding]},
+        request=httpx.Request("POST", "http://fake-ollama:11434/api/embed"),
+    )
 
 
 # ===========================================================================
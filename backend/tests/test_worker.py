@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +10,7 @@ from sqlmodel import Session, select
 
 from app.config import Settings
 from app.models.job import BackgroundJob, JobStatus
+from app.services.llm import LLMService
 from app.worker import BackgroundWorker, Job, JobType
 
 
@@ -68,6 +70,36 @@ def patch_engine_fixture(engine):
 # ── Tests ────────────────────────────────────────────────────────────
 
 
+class TestJobLoopCleanup:
+    def test_close_job_loop_closes_llm_client(self):
+        """The LLM client is closed on the job loop before the loop itself."""
+        mock_llm = MagicMock()
+        mock_llm.close = AsyncMock()
+        worker = _make_worker(mock_llm=mock_llm)
+        loop = asyncio.new_event_loop()
+
+        worker._close_job_loop(loop)
+
+        mock_llm.close.assert_awaited_once()
+        assert loop.is_closed()
+
+    def test_pooled_clients_do_not_outlive_job_loops(self):
+        """Repeated per-job loops leave no pooled LLM clients behind."""
+        llm = LLMService(ollama_url="http://ollama.test")
+        worker = _make_worker(mock_llm=llm)
+
+        async def _use_client():
+            return llm._get_client()
+
+        for _ in range(3):
+            loop = asyncio.new_event_loop()
+            client = loop.run_until_complete(_use_client())
+            worker._close_job_loop(loop)
+            assert client.is_closed
+
+        assert len(llm._loop_clients) == 0
+
+
 class TestSuccessfulJobPersisted:
     def test_successful_job_persisted(self, engine, session, patch_engine):
         """Submit job, mock services to succeed, verify DB row has status=succeeded."""